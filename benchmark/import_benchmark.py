@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the cold start cost of connector-factory. Each run imports the
+package in a fresh interpreter and creates a connector, so it measures what a
+short-lived CLI job or Lambda pays before the first query. Exit code is 1 if
+the median is above --max-ms or heavy modules are imported by the package
+import.
+
+Ex:
+  * python benchmark/import_benchmark.py --runs 20 --max-ms 150
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules which must not be loaded by "import connector_factory".
+HEAVY_MODULES = ["pandas", "sqlalchemy", "numpy", "asyncio", "botocore", "cryptography", "pydynamodb"]
+
+CODE = """
+import json, sys, time
+start = time.perf_counter()
+import connector_factory
+imported = time.perf_counter()
+heavy = [module for module in {heavy} if module in sys.modules]
+from connector_factory import ConnectorFactory
+ConnectorFactory(connector_type={connector_type!r}, config={{"database": "benchmark_import"}})
+created = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000,
+                  "create_ms": (created - start) * 1000,
+                  "heavy": heavy}}))
+"""
+
+
+def run(connector_type: str):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = CODE.format(heavy=HEAVY_MODULES, connector_type=connector_type)
+    output = subprocess.run([sys.executable, "-c", code],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                            cwd=root)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--connector-type", default="sqlite")
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    results = [run(connector_type=args.connector_type) for _ in range(args.runs)]
+    import_ms = statistics.median(result["import_ms"] for result in results)
+    create_ms = statistics.median(result["create_ms"] for result in results)
+    heavy = sorted(set(module for result in results for module in result["heavy"]))
+
+    print(f"{'import connector_factory':<40}{import_ms:>10.1f} ms")
+    print(f"{'import + ConnectorFactory(' + args.connector_type + ')':<40}{create_ms:>10.1f} ms")
+
+    failed = False
+    if heavy:
+        print(f"Heavy modules imported by the package: {heavy}")
+        failed = True
+    if args.max_ms is not None and import_ms > args.max_ms:
+        print(f"Import time {import_ms:.1f} ms is above {args.max_ms} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+
+"""
+Benchmark to compare rows/sec of execute_df load methods on PostgreSQL.
+Connection details are read from the standard libpq environment variables.
+
+Ex:
+  * PGHOST=localhost PGUSER=postgres PGPASSWORD=postgres PGDATABASE=postgres \\
+    python benchmark/postgres_load_benchmark.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Run from a checkout without installing the package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import pandas
+
+from connector_factory import ConnectorFactory
+
+
+def create_df(rows: int):
+    rng = numpy.random.default_rng(seed=7)
+    return pandas.DataFrame({
+        "id": numpy.arange(rows),
+        "value": rng.random(rows),
+        "name": [f"name_{i}" for i in range(rows)],
+        "created": pandas.Timestamp("2024-01-01") + pandas.to_timedelta(numpy.arange(rows), unit="s")
+    })
+
+
+def run(db: ConnectorFactory, df: pandas.DataFrame, load_method: str, chunk_size: int):
+    table_name = f"benchmark_load_{load_method}"
+    start = time.perf_counter()
+    db.execute_df(panda_df=df,
+                  table_name=table_name,
+                  chunk_size=chunk_size,
+                  exist_action="replace",
+                  load_method=load_method)
+    elapsed = time.perf_counter() - start
+    db.execute_sql(sql=f"drop table {table_name}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--methods", nargs="+", default=["insert", "multi", "copy"])
+    args = parser.parse_args()
+
+    config = {
+        "username": os.environ.get("PGUSER", "postgres"),
+        "password": os.environ.get("PGPASSWORD", "postgres"),
+        "host": os.environ.get("PGHOST", "localhost"),
+        "port": os.environ.get("PGPORT", 5432),
+        "database": os.environ.get("PGDATABASE", "postgres")
+    }
+    db = ConnectorFactory(connector_type="postgre", config=config)
+    df = create_df(rows=args.rows)
+
+    print(f"{'method':<10}{'rows':>12}{'seconds':>12}{'rows/sec':>14}")
+    for load_method in args.methods:
+        elapsed = run(db=db, df=df, load_method=load_method, chunk_size=args.chunk_size)
+        print(f"{load_method:<10}{args.rows:>12}{elapsed:>12.2f}{args.rows / elapsed:>14.0f}")
+
+    db.destroy()
+
+
+if __name__ == "__main__":
+    main()
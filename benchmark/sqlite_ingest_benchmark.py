@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""
+Benchmark of the test_database_factory workload scaled up on Sqlite3. It
+compares the default connection against the performance profiles for single
+row execute_sql writes and for execute_df with the insert and executemany load
+methods.
+
+Ex:
+  * python benchmark/sqlite_ingest_benchmark.py --statements 2000 --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Run from a checkout without installing the package.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+import pandas
+
+from connector_factory import ConnectorFactory
+
+
+def create_db(profile: str):
+    temp_dir = tempfile.gettempdir()
+    database = f"benchmark_{profile}"
+    for suffix in ["", "-wal", "-shm"]:
+        db_file = os.path.join(temp_dir, f"{database}.db{suffix}")
+        os.remove(db_file) if os.path.exists(db_file) else None
+
+    config = {
+        "database": database,
+        "path": temp_dir,
+        "profile": profile
+    }
+    db = ConnectorFactory(connector_type="sqlite", config=config)
+    db.create_session()
+    return db
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run_statements(db: ConnectorFactory, statements: int):
+    db.execute_sql(sql="create table test (id int PRIMARY KEY)")
+    for i in range(statements):
+        db.execute_sql(sql=f"insert into test values ({i})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--profiles", nargs="+", default=["default", "balanced", "bulk"])
+    args = parser.parse_args()
+
+    df = pandas.DataFrame({
+        "id": numpy.arange(args.rows),
+        "value": numpy.random.default_rng(seed=7).random(args.rows),
+        "name": [f"name_{i}" for i in range(args.rows)]
+    })
+
+    print(f"{'profile':<10}{'workload':<24}{'rows':>10}{'seconds':>10}{'rows/sec':>12}")
+    for profile in args.profiles:
+        db = create_db(profile=profile)
+
+        elapsed = timed(run_statements, db, args.statements)
+        print(f"{profile:<10}{'execute_sql':<24}{args.statements:>10}{elapsed:>10.2f}{args.statements / elapsed:>12.0f}")
+
+        for load_method in ["insert", "executemany"]:
+            elapsed = timed(db.execute_df,
+                            panda_df=df,
+                            table_name=f"copy_{load_method}",
+                            chunk_size=args.chunk_size,
+                            exist_action="replace",
+                            load_method=load_method)
+            workload = f"execute_df {load_method}"
+            print(f"{profile:<10}{workload:<24}{args.rows:>10}{elapsed:>10.2f}{args.rows / elapsed:>12.0f}")
+
+        db.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+
+"""
+Benchmark suite of the SQL hot paths on Sqlite3. Every case runs in its own
+interpreter so peak RSS is measured per case, and is repeated to report
+latency percentiles next to rows/sec.
+
+Cases:
+  * execute_sql:        executemany INSERT with list of bind parameters.
+  * execute_df:         DataFrame write with load method insert.
+  * execute_df_chunk:   DataFrame write in chunks of --chunk-size.
+  * get_df:             Read of the whole table.
+  * get_df_chunk:       Read of the whole table in chunks of --chunk-size.
+
+Results are written as JSON with --output. Passing a previous result with
+--compare reports the change of rows/sec per case and the exit code is 1 if
+any case is slower than --threshold.
+
+Ex:
+  * python benchmark/sqlite_suite_benchmark.py --rows 10000 100000 1000000 --output base.json
+  * python benchmark/sqlite_suite_benchmark.py --rows 10000 100000 1000000 --compare base.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CASES = ["execute_sql", "execute_df", "execute_df_chunk", "get_df", "get_df_chunk"]
+
+
+def create_df(rows: int):
+    import numpy
+    import pandas
+
+    rng = numpy.random.default_rng(seed=7)
+    return pandas.DataFrame({
+        "id": numpy.arange(rows),
+        "value": rng.random(rows),
+        "quantity": pandas.array(rng.integers(0, 1000, rows), dtype="Int64"),
+        "name": [f"name_{i}" for i in range(rows)],
+        "active": rng.random(rows) > 0.5,
+        "created": pandas.Timestamp("2024-01-01") + pandas.to_timedelta(numpy.arange(rows), unit="s")
+    })
+
+
+def create_db(case: str, rows: int):
+    from connector_factory import ConnectorFactory
+
+    temp_dir = tempfile.gettempdir()
+    database = f"benchmark_suite_{case}_{rows}"
+    for suffix in ["", "-wal", "-shm", "-journal"]:
+        db_file = os.path.join(temp_dir, f"{database}.db{suffix}")
+        os.remove(db_file) if os.path.exists(db_file) else None
+
+    config = {
+        "database": database,
+        "path": temp_dir
+    }
+    db = ConnectorFactory(connector_type="sqlite", config=config)
+    db.create_session()
+    return db
+
+
+def peak_rss():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux report kilobytes and macOS bytes.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_case(case: str, rows: int, repeat: int, chunk_size: int):
+    df = create_df(rows=rows)
+    db = create_db(case=case, rows=rows)
+    latencies = []
+
+    if case == "execute_sql":
+        db.execute_sql(sql="create table test (id int, value float, name text)")
+        params = df[["id", "value", "name"]].to_dict(orient="records")
+        for _ in range(repeat):
+            db.execute_sql(sql="delete from test")
+            start = time.perf_counter()
+            db.execute_sql(sql="insert into test values (:id, :value, :name)",
+                           params=params)
+            latencies.append(time.perf_counter() - start)
+    elif case in ["execute_df", "execute_df_chunk"]:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            db.execute_df(panda_df=df,
+                          table_name="test",
+                          chunk_size=chunk_size if case == "execute_df_chunk" else None,
+                          exist_action="replace")
+            latencies.append(time.perf_counter() - start)
+    else:
+        db.execute_df(panda_df=df,
+                      table_name="test",
+                      chunk_size=chunk_size,
+                      exist_action="replace",
+                      load_method="executemany")
+        del df
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = db.get_df(sql="select * from test",
+                               chunk_size=chunk_size if case == "get_df_chunk" else None)
+            latencies.append(time.perf_counter() - start)
+            assert len(result) == rows
+            del result
+
+    db.destroy()
+    return {"case": case,
+            "rows": rows,
+            "latencies": latencies,
+            "peak_rss": peak_rss()}
+
+
+def percentile(values: list, percent: float):
+    values = sorted(values)
+    index = min(int(round(percent / 100 * (len(values) - 1))), len(values) - 1)
+    return values[index]
+
+
+def summarize(result: dict):
+    latencies = result.pop("latencies")
+    median = statistics.median(latencies)
+    result.update({"p50": median,
+                   "p90": percentile(latencies, 90),
+                   "p99": percentile(latencies, 99),
+                   "rows_per_sec": result["rows"] / median if median else None})
+    return result
+
+
+def spawn(case: str, rows: int, repeat: int, chunk_size: int):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ,
+           "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run([sys.executable, os.path.abspath(__file__),
+                             "--run-case", case,
+                             "--rows", str(rows),
+                             "--repeat", str(repeat),
+                             "--chunk-size", str(chunk_size)],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                            env=env)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def compare(results: list, baseline: list, threshold: float):
+    baseline = {(result["case"], result["rows"]): result for result in baseline}
+    regressions = []
+
+    print()
+    print(f"{'case':<20}{'rows':>10}{'base rows/sec':>16}{'rows/sec':>14}{'change':>10}")
+    for result in results:
+        base = baseline.get((result["case"], result["rows"]))
+        if not base or not base["rows_per_sec"] or not result["rows_per_sec"]:
+            continue
+        change = result["rows_per_sec"] / base["rows_per_sec"] - 1
+        print(f"{result['case']:<20}{result['rows']:>10}{base['rows_per_sec']:>16.0f}{result['rows_per_sec']:>14.0f}{change:>10.1%}")
+        if change < -threshold:
+            regressions.append(result)
+
+    for result in regressions:
+        print(f"Regression: {result['case']} with {result['rows']} rows is slower than {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--cases", nargs="+", default=CASES, choices=CASES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=50000)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--compare", default=None)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--run-case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        result = run_case(case=args.run_case,
+                          rows=args.rows[0],
+                          repeat=args.repeat,
+                          chunk_size=args.chunk_size)
+        print(json.dumps(result))
+        return
+
+    results = []
+    print(f"{'case':<20}{'rows':>10}{'rows/sec':>14}{'p50 s':>10}{'p90 s':>10}{'p99 s':>10}{'peak MB':>10}")
+    for rows in args.rows:
+        for case in args.cases:
+            result = summarize(spawn(case=case,
+                                     rows=rows,
+                                     repeat=args.repeat,
+                                     chunk_size=args.chunk_size))
+            results.append(result)
+            print(f"{case:<20}{rows:>10}{result['rows_per_sec']:>14.0f}{result['p50']:>10.3f}"
+                  f"{result['p90']:>10.3f}{result['p99']:>10.3f}{result['peak_rss'] / 1024 / 1024:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump({"python": sys.version.split()[0],
+                       "chunk_size": args.chunk_size,
+                       "repeat": args.repeat,
+                       "results": results}, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            baseline = json.load(baseline)["results"]
+        if compare(results=results, baseline=baseline, threshold=args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,34 @@
-from .factory import ConnectorFactory
+import importlib
+
+# Public names are imported on first access, so "import connector_factory"
+# stays cheap and pandas, SQLAlchemy and the connector drivers are only
+# loaded when a connector is used.
+_EXPORTS = {"ConnectorFactory": ".factory",
+            "QueryResult": ".factory",
+            "register_connector": ".factory",
+            "AsyncConnectorFactory": ".async_factory",
+            "ResultCache": ".cache",
+            "EngineRegistry": ".registry",
+            "ENGINE_REGISTRY": ".registry",
+            "QueryEvent": ".instrumentation",
+            "QueryListener": ".instrumentation",
+            "OpenTelemetryListener": ".instrumentation",
+            "PrometheusListener": ".instrumentation",
+            "add_listener": ".instrumentation",
+            "remove_listener": ".instrumentation"}
+
+__all__ = list(_EXPORTS.keys())
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+
+"""
+File holds the asyncio version of ConnectorFactory. Connectors with asyncio
+driver (asyncpg, aiomysql, aiosqlite) run on SQLAlchemy async engine, other
+connectors run the synchronous ConnectorFactory in a worker thread.
+"""
+
+import asyncio
+import logging
+
+from .factory import ConnectorFactory, is_read_statement
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncConnectorFactory(object):
+    """Class handle the asyncio API of the connectors.
+
+    Async drivers used by connector type:
+      * postgre, redshift: asyncpg
+      * mysql, mariadb: aiomysql
+      * sqlite: aiosqlite
+    Other connectors like salesforce, s3select, dynamodb, snowflake etc. are
+    executed in thread with asyncio.to_thread.
+
+    Methods:
+    --------
+
+        __init__:               Initaization functions
+        get_engine:             Method to create the SQLAlchemy async engine.
+        execute_sql:            Function to execute DML or DDL queries and return
+                                with rows if rows exist.
+        execute_df:             Function to execute Pandas DataFrame object.
+        get_df:                 Function to execute DML select queries and return
+                                as Pandas DataFrame.
+        iter_df:                Async generator of Pandas DataFrame chunks.
+        destroy:                Function to close the engine.
+    """
+
+    def __init__(self,
+                 connector_type: str,
+                 config: dict,
+                 debug: bool = False
+                 ):
+        """Initialization function to initlaize the object
+
+        Args:
+            connector_type (str): (Required) => Type of connector type for connection. Same as ConnectorFactory.
+            config (dict):  (Required) => Dictonary of connection details like username, password, host, port etc.
+            debug (bool, optional): (Optional) => Detailed logs for debugging.. Defaults to False.
+        """
+        self.factory = ConnectorFactory(connector_type=connector_type,
+                                        config=config,
+                                        debug=debug)
+        self.engine_type = connector_type
+        self.debug = debug
+        self.connection = self.factory.connection
+        self.is_async = bool(self.connection and self.connection.async_driver)
+        self.engine = None
+
+    async def get_engine(self):
+        """Method to create the SQLAlchemy async engine of the connector.
+
+        Raises:
+            ValueError: Invalid connection details.
+
+        Returns:
+            engine: sqlalchemy.ext.asyncio.AsyncEngine
+        """
+        if not self.engine:
+            from sqlalchemy.engine import make_url
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            uri, _, message = self.connection.create_uri()
+            if not uri:
+                raise ValueError(message)
+
+            url = make_url(uri).set(drivername=self.connection.async_driver)
+            param = {**self.connection.get_async_param(),
+                     **self.connection.get_pool_param()}
+            # QueuePool of the sync engine is not usable with asyncio.
+            if param.get("poolclass") is not None and param["poolclass"].__name__ == "QueuePool":
+                from sqlalchemy.pool import AsyncAdaptedQueuePool
+                param["poolclass"] = AsyncAdaptedQueuePool
+
+            logger.info(
+                f"Creating SQLAlchemy async engine with driver {self.connection.async_driver}")
+            self.engine = create_async_engine(url, echo=self.debug, **param)
+            self.connection.configure_engine(self.engine.sync_engine)
+
+        return self.engine
+
+    async def execute_sql(self, sql: str, params=None):
+        """
+        Function to execute DML or DDL queries and return if rows exist.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:        (Required) => Plain DDL or DML query to execute on
+                        Database.
+            params:     (Optional) => Values of :name bind parameters in sql.
+                        Dictonary executes the statement once and list of
+                        dictonary executes it as executemany.
+                        Default is None.
+        *******
+        Return:
+        -------
+
+            rows:       If rows in case of DML select queries else none.
+        """
+        if not self.is_async:
+            return await asyncio.to_thread(self.factory.execute_sql,
+                                           sql=sql,
+                                           params=params)
+
+        from .decorator import get_statement
+
+        logger.info(f"Got SQL statement to execute: {sql}")
+        if isinstance(params, list) and not params:
+            return None
+
+        engine = await self.get_engine()
+        rows = None
+        async with engine.connect() as connection:
+            result = await connection.execute(get_statement(sql), params)
+            if result.returns_rows:
+                rows = result.fetchall()
+
+            # Writes returning rows (INSERT ... RETURNING) are committed too.
+            if rows is None or not is_read_statement(sql):
+                await connection.commit()
+        return rows
+
+    async def execute_df(self,
+                         panda_df,
+                         table_name: str,
+                         chunk_size: int = None,
+                         exist_action: str = "append",
+                         load_method: str = None):
+        """
+        Function to execute Pandas DataFrame object to create, replace or
+        append table with DataFrame table objects. Bulk load methods of the
+        connector like copy or load_data use the synchronous driver in thread.
+
+        ***********
+        Attributes:
+        -----------
+
+            panda_df:       (Required) => Pandas DataFrame table object to
+                            update the table.
+            table_name:     (Required) => Name of table .
+            chunk_size:     (Optional) => chunck size to update the table in
+                            chunks.
+            exist_action:   (Optional) => Action on if table already exist.
+                            Default: append mode. Others modes are replace
+                            or fail.
+            load_method:    (Optional) => One of insert, multi or connector
+                            specific bulk load method.
+                            Default: insert.
+        """
+        if not self.is_async or load_method not in [None, "insert", "multi"]:
+            return await asyncio.to_thread(self.factory.execute_df,
+                                           panda_df=panda_df,
+                                           table_name=table_name,
+                                           chunk_size=chunk_size,
+                                           exist_action=exist_action,
+                                           load_method=load_method)
+
+        if not len(panda_df):
+            msg = f"Invalid DataFrame"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        method = self.connection.get_load_method(load_method=load_method)
+        engine = await self.get_engine()
+        async with engine.begin() as connection:
+            await connection.run_sync(lambda sync_connection: panda_df.to_sql(name=table_name,
+                                                                               con=sync_connection,
+                                                                               if_exists=exist_action,
+                                                                               chunksize=chunk_size,
+                                                                               index=False,
+                                                                               method=method))
+
+    async def get_df(self,
+                     sql: str,
+                     chunk_size: int = None):
+        """
+        Function to execute DML select queries and return Pandas DataFrame
+        object.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            chunk_size:     (Optional) => Number of rows fetched per round
+                            trip.
+                            Default: None to fetch all records at once.
+        *******
+        Return:
+        -------
+
+            df:             Pandas DataFrame.
+        """
+        if not self.is_async:
+            return await asyncio.to_thread(self.factory.get_df,
+                                           sql=sql,
+                                           chunk_size=chunk_size)
+
+        import pandas
+
+        if chunk_size:
+            chunks = [chunk async for chunk in self.iter_df(sql=sql,
+                                                            chunk_size=chunk_size)]
+            return pandas.concat(chunks).reset_index(drop=True)
+
+        engine = await self.get_engine()
+        async with engine.connect() as connection:
+            return await connection.run_sync(lambda sync_connection: pandas.read_sql(sql=sql,
+                                                                                      con=sync_connection))
+
+    async def iter_df(self,
+                      sql: str,
+                      chunk_size: int):
+        """
+        Async generator to execute DML select queries and yield Pandas
+        DataFrame chunks while the rows are streamed from the database.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            chunk_size:     (Required) => Number of rows in each chunk.
+        *******
+        Return:
+        -------
+
+            generator:      Async generator of Pandas DataFrame chunks.
+        """
+        if not chunk_size or chunk_size < 1:
+            msg = f"Invalid chunk size {chunk_size}. Chunk size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if not self.is_async:
+            chunks = await asyncio.to_thread(self.factory.iter_df,
+                                             sql=sql,
+                                             chunk_size=chunk_size)
+            try:
+                while True:
+                    chunk = await asyncio.to_thread(next, chunks, None)
+                    if chunk is None:
+                        break
+                    yield chunk
+            finally:
+                # Caller stopped early, release the cursor of the generator.
+                await asyncio.to_thread(chunks.close)
+            return
+
+        import pandas
+        from sqlalchemy import text
+
+        engine = await self.get_engine()
+        async with engine.connect() as connection:
+            result = await connection.stream(text(sql))
+            columns = list(result.keys())
+            async for rows in result.partitions(chunk_size):
+                yield pandas.DataFrame.from_records(rows,
+                                                    columns=columns,
+                                                    coerce_float=True)
+
+    async def destroy(self):
+        """
+        Function to close the engine and sessions.
+        """
+        if self.engine:
+            await self.engine.dispose()
+            self.engine = None
+
+        if self.connection:
+            await asyncio.to_thread(self.factory.destroy)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+"""
+File holds the query result cache used by ConnectorFactory to serve repeated
+get_df calls without hitting the database.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from .common.common import Common
+
+
+logger = logging.getLogger(__name__)
+
+DISK_FORMATS = ["parquet", "arrow"]
+
+
+class ResultCache(object):
+    """Class handle the in-memory LRU cache of Pandas DataFrame results with
+    TTL expiry and optional on-disk tier for large results.
+
+    Results are keyed by identity of the connector and normalized sql. Memory
+    tier is bounded by bytes, least recently used results are evicted first.
+    Results larger than disk_threshold are written to disk_path as Parquet or
+    Arrow IPC file if disk_path is provided (requires pyarrow).
+
+    Methods:
+    --------
+
+        get:                    Return cached DataFrame or None.
+        put:                    Cache DataFrame of the sql.
+        invalidate:             Remove cached results of connector or sql.
+        clear:                  Remove all cached results.
+    """
+
+    def __init__(self,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 ttl: float = 300,
+                 disk_path: str = None,
+                 disk_threshold: int = 64 * 1024 * 1024,
+                 max_disk_bytes: int = 4 * 1024 * 1024 * 1024,
+                 disk_format: str = "parquet"):
+        """Initialization function to initlaize the object
+
+        Args:
+            max_bytes (int, optional): (Optional) => Maximum bytes of results kept in memory. Defaults to 256 MB.
+            ttl (float, optional): (Optional) => Seconds after which a cached result expires. None to never expire. Defaults to 300.
+            disk_path (str, optional): (Optional) => Folder for the on-disk tier. Defaults to None to keep only memory tier.
+            disk_threshold (int, optional): (Optional) => Results larger than this bytes are written to disk tier. Defaults to 64 MB.
+            max_disk_bytes (int, optional): (Optional) => Maximum bytes of results kept on disk. Defaults to 4 GB.
+            disk_format (str, optional): (Optional) => One of parquet or arrow (Arrow IPC). Defaults to parquet.
+        """
+        if disk_format not in DISK_FORMATS:
+            raise ValueError(
+                f"Invalid disk format {disk_format}. Valid values are {DISK_FORMATS}")
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_path = disk_path
+        self.disk_threshold = disk_threshold
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_format = disk_format
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.disk_path:
+            os.makedirs(self.disk_path, exist_ok=True)
+
+    @staticmethod
+    def normalize_sql(sql: str):
+        """Collapse whitespace and trailing semicolon so formatting of the
+        same query does not create new entry."""
+        return re.sub(r"\s+", " ", sql).strip().rstrip(";").strip()
+
+    def _key(self, identity: str, sql: str):
+        return Common.fingerprint(identity, self.normalize_sql(sql))
+
+    def get(self, identity: str, sql: str):
+        """Return copy of cached DataFrame of the sql or None if not cached or
+        expired.
+
+        Args:
+            identity (str): Identity of the connector.
+            sql (str): Query of the result.
+
+        Returns:
+            df: Pandas DataFrame or None.
+        """
+        key = self._key(identity=identity, sql=sql)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry["expires_at"] is not None and entry["expires_at"] < time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if not entry:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            if entry["df"] is not None:
+                return entry["df"].copy()
+            path = entry["path"]
+
+        logger.info(f"Read cached result from {path}")
+        try:
+            return self._read(path=path)
+        except (OSError, ValueError):
+            # Missing or truncated file, pyarrow.ArrowInvalid is a ValueError.
+            logger.warning(f"Cached result {path} is not readable")
+            with self._lock:
+                self._remove(key)
+            return None
+
+    def put(self, identity: str, sql: str, df):
+        """Cache the DataFrame of the sql. Result is kept in memory, written
+        to disk tier if larger than disk_threshold, or skipped if it does not
+        fit in either tier.
+
+        Args:
+            identity (str): Identity of the connector.
+            sql (str): Query of the result.
+            df (pandas.DataFrame): Result to cache.
+        """
+        if df is None:
+            return
+
+        key = self._key(identity=identity, sql=sql)
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        entry = {"identity": identity,
+                 "expires_at": expires_at,
+                 "nbytes": nbytes,
+                 "df": None,
+                 "path": None}
+
+        if self.disk_path and nbytes > self.disk_threshold:
+            if nbytes > self.max_disk_bytes:
+                return
+            path = os.path.join(self.disk_path, f"{key}.{self.disk_format}")
+            self._write(df=df, path=path)
+            entry["path"] = path
+        elif nbytes <= self.max_bytes:
+            entry["df"] = df.copy()
+        else:
+            logger.info(f"Result of {nbytes} bytes is larger than cache size")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, keep_file=entry["path"] is not None)
+            self._entries[key] = entry
+            if entry["path"]:
+                self.disk_bytes += nbytes
+            else:
+                self.memory_bytes += nbytes
+            self._evict()
+
+    def invalidate(self, identity: str = None, sql: str = None):
+        """Remove cached results. If only identity is provided, all results of
+        the connector are removed.
+
+        Args:
+            identity (str, optional): Identity of the connector. Defaults to None for all connectors.
+            sql (str, optional): Query of the result. Defaults to None for all queries.
+        """
+        with self._lock:
+            if identity is not None and sql is not None:
+                key = self._key(identity=identity, sql=sql)
+                if key in self._entries:
+                    self._remove(key)
+                return
+
+            for key in list(self._entries):
+                if identity is None or self._entries[key]["identity"] == identity:
+                    self._remove(key)
+
+    def clear(self):
+        """Remove all cached results."""
+        self.invalidate()
+
+    def _evict(self):
+        now = time.monotonic()
+        for key in list(self._entries):
+            expires_at = self._entries[key]["expires_at"]
+            if expires_at is not None and expires_at < now:
+                self._remove(key)
+
+        for key in list(self._entries):
+            if self.memory_bytes <= self.max_bytes and self.disk_bytes <= self.max_disk_bytes:
+                break
+            entry = self._entries[key]
+            if entry["path"] and self.disk_bytes > self.max_disk_bytes:
+                self._remove(key)
+            elif not entry["path"] and self.memory_bytes > self.max_bytes:
+                self._remove(key)
+
+    def _remove(self, key: str, keep_file: bool = False):
+        # Entry may be already evicted by another thread.
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry["path"]:
+            self.disk_bytes -= entry["nbytes"]
+            if not keep_file and os.path.exists(entry["path"]):
+                os.remove(entry["path"])
+        else:
+            self.memory_bytes -= entry["nbytes"]
+
+    def _write(self, df, path: str):
+        import pyarrow
+
+        table = pyarrow.Table.from_pandas(df)
+        if self.disk_format == "parquet":
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, path)
+        else:
+            import pyarrow.feather
+            pyarrow.feather.write_feather(table, path)
+
+    def _read(self, path: str):
+        if self.disk_format == "parquet":
+            import pyarrow.parquet
+            table = pyarrow.parquet.read_table(path)
+        else:
+            import pyarrow.feather
+            table = pyarrow.feather.read_table(path)
+        return table.to_pandas()
@@ -4,6 +4,7 @@
 File to common methods exposed as static under Common class.
 """
 
+import hashlib
 import logging
 
 
@@ -20,6 +21,9 @@ class Common(object):
 
         normaize_connection_dict:   Method to convert the key of dictonary
                                     in upper case to ensure uniform access.
+        fingerprint:                Method to create a stable hash of connection
+                                    details without keeping secrets in plain
+                                    text.
     """
 
     @staticmethod
@@ -53,3 +57,37 @@ class Common(object):
             conn_dict = {key.lower(): value for key,
                          value in connection_dict.items()}
         return conn_dict
+
+    @staticmethod
+    def fingerprint(*values):
+        """
+        Method helps to create a stable identity of connection details like
+        connector type, config or engine parameters. Values are hashed with
+        SHA-256 so secrets like password are never kept in plain text.
+        Dictonary keys are sorted so the order of keys does not matter.
+
+        ***********
+        Attributes:
+        -----------
+
+            values:             (Required) => Values to include in the
+                                fingerprint.
+        *******
+        Return:
+        -------
+
+            fingerprint:        Hex digest of the values.
+        """
+        def normalize(value):
+            if isinstance(value, dict):
+                return "{" + ",".join(f"{repr(key)}:{normalize(value[key])}"
+                                      for key in sorted(value, key=str)) + "}"
+            if isinstance(value, (list, tuple)):
+                return "[" + ",".join(normalize(item) for item in value) + "]"
+            return repr(value)
+
+        digest = hashlib.sha256()
+        for value in values:
+            digest.update(normalize(value).encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
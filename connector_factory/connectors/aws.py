@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
-import pandas
+from typing import TYPE_CHECKING
 
 from ..decorator import Decorator
 
+if TYPE_CHECKING:
+    import pandas
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,14 +43,29 @@ class Aws(Decorator):
         logger.info("AWS will return the object of boto3 session")
         return self.session, is_valid, message
 
-    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append"):
+    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append", load_method: str = None):
+        raise ValueError(f"Unsupported method for AWS")
+
+    def transaction(self):
         raise ValueError(f"Unsupported method for AWS")
 
-    def execute_sql(self, sql: str):
+    def get_partition_queries(self, sql: str, partition_on: str = None, num_partitions: int = None, lower_bound=None, upper_bound=None, predicates: list = None):
+        raise ValueError(f"Unsupported method for AWS")
+
+    def execute_sql(self, sql: str, params=None):
         raise ValueError(f"Unsupported method for AWS")
 
     def get_df(self, sql: str, chunk_size: int = None):
         raise ValueError(f"Unsupported method for AWS")
 
+    def iter_df(self, sql: str, chunk_size: int = None):
+        raise ValueError(f"Unsupported method for AWS")
+
+    def get_arrow(self, sql: str, batch_size: int = None):
+        raise ValueError(f"Unsupported method for AWS")
+
+    def get_polars(self, sql: str, batch_size: int = None):
+        raise ValueError(f"Unsupported method for AWS")
+
     def destroy(self):
         pass
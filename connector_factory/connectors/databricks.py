@@ -96,3 +96,34 @@ class Databricks(Decorator):
                 raise ValueError(message)
 
         return self.session, is_valid, message
+
+    def _iter_arrow_batches(self, sql: str, batch_size: int = None):
+        # Databricks SQL connector fetch results as Arrow natively, use the
+        # DBAPI cursor directly to avoid the row by row conversion.
+        connection = self.session.bind.raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql)
+                columns = [column[0] for column in cursor.description or []]
+                is_empty = True
+
+                while True:
+                    if batch_size:
+                        table = cursor.fetchmany_arrow(batch_size)
+                    else:
+                        table = cursor.fetchall_arrow()
+
+                    for batch in table.to_batches(max_chunksize=batch_size):
+                        is_empty = False
+                        yield batch
+
+                    if not batch_size or table.num_rows < batch_size:
+                        break
+
+                if is_empty:
+                    yield self._empty_arrow_batch(columns=columns)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
-import pandas
+from typing import TYPE_CHECKING
 import os
 from ..decorator import Decorator
-from pydynamodb import connect
+
+if TYPE_CHECKING:
+    import pandas
 
 logger = logging.getLogger(__name__)
 
@@ -50,15 +53,20 @@ class DynamoDb(Decorator):
                 raise ValueError(msg)
             else:
                 logger.info("Session is not created. Try to create a session")
+                from pydynamodb import connect
                 self.session = connect(region_name="us-east-1").cursor()
 
         logger.info("DynaoDB will return the object of PyDynamoDB cursor")
         return self.session, is_valid, message
 
-    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append"):
+    def get_max_workers(self):
+        # Single PyDynamoDB cursor is shared by the connector.
+        return 1
+
+    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append", load_method: str = None):
         raise ValueError(f"Unsupported method for DynaoDB")
 
-    def __execute_sql(self, sql: str = None):
+    def __execute_sql(self, sql: str = None, params=None):
         logger.info(f"Got SQL statement to execute: {sql}")
         logger.info("Supported DDL/DML queries by PyDanomoDB can be executed")
 
@@ -69,19 +77,42 @@ class DynamoDb(Decorator):
                 logger.error(msg)
                 raise ValueError(msg)
 
-        self.session.execute(sql)
+        if isinstance(params, list):
+            self.session.executemany(sql, params)
+        elif params is not None:
+            self.session.execute(sql, params)
+        else:
+            self.session.execute(sql)
 
-    def execute_sql(self, sql: str = None):
-        self.__execute_sql(sql=sql)
-        if self.session.rowcount and not self.session.errors:
-            rows = self.session.fetchall()
-            return rows
+    def transaction(self):
+        raise ValueError(f"Unsupported method for DynaoDB")
 
-        msg = f"Failed to execute query, details : {str(self.session.errors)}"
-        logger.error(msg)
-        raise ValueError(msg)
+    def get_partition_queries(self, sql: str, partition_on: str = None, num_partitions: int = None, lower_bound=None, upper_bound=None, predicates: list = None):
+        raise ValueError(f"Unsupported method for DynaoDB")
+
+    def execute_sql(self, sql: str = None, params=None):
+        with self.instrument("execute_sql", sql) as event:
+            self.__execute_sql(sql=sql, params=params)
+            if self.session.rowcount and not self.session.errors:
+                rows = self.session.fetchall()
+                if event is not None:
+                    event.add(rows=len(rows))
+                return rows
+
+            msg = f"Failed to execute query, details : {str(self.session.errors)}"
+            logger.error(msg)
+            raise ValueError(msg)
 
     def get_df(self, sql: str = None, chunk_size: int = None):
+        with self.instrument("get_df", sql) as event:
+            df = self.__query_df(sql=sql)
+            if event is not None:
+                event.add(df)
+            return df
+
+    def __query_df(self, sql: str = None):
+        import pandas
+
         self.__execute_sql(sql=sql)
         if self.session.rowcount and not self.session.errors:
             df = pandas.DataFrame(self.session.fetchall())
@@ -92,6 +123,44 @@ class DynamoDb(Decorator):
         logger.error(msg)
         raise ValueError(msg)
 
+    def iter_df(self, sql: str = None, chunk_size: int = None):
+        if not chunk_size or chunk_size < 1:
+            msg = f"Invalid chunk size {chunk_size}. Chunk size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        return self._instrument_stream(operation="iter_df",
+                                       sql=sql,
+                                       items=self.__query_chunks(sql=sql, chunk_size=chunk_size))
+
+    def __query_chunks(self, sql: str, chunk_size: int):
+        self.__execute_sql(sql=sql)
+        if self.session.errors:
+            msg = f"Failed to execute query, details : {str(self.session.errors)}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        return self.__iter_chunks(chunk_size=chunk_size)
+
+    def __iter_chunks(self, chunk_size: int):
+        import pandas
+
+        columns = self.session.result_set.metadata.keys()
+        while True:
+            rows = self.session.fetchmany(chunk_size)
+            if not rows:
+                break
+            df = pandas.DataFrame(rows)
+            df.columns = columns
+            yield df
+
+    def _iter_arrow_batches(self, sql: str = None, batch_size: int = None):
+        if batch_size:
+            frames = self.__query_chunks(sql=sql, chunk_size=batch_size)
+        else:
+            frames = [self.__query_df(sql=sql)]
+        return self._iter_arrow_batches_from_df(frames=frames)
+
     def destroy(self):
         try:
             self.session.close()
@@ -3,6 +3,7 @@
 
 import logging
 import os
+import tempfile
 from urllib.parse import quote_plus as urlquote
 
 from ..decorator import Decorator
@@ -10,7 +11,21 @@ from ..decorator import Decorator
 logger = logging.getLogger(__name__)
 
 
+# Error codes when LOAD DATA LOCAL INFILE is disabled on client or server.
+# 1148: ER_NOT_ALLOWED_COMMAND, 2068: CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+# 3948: ER_CLIENT_LOCAL_FILES_DISABLED
+LOCAL_INFILE_DISABLED_ERRORS = [1148, 2068, 3948]
+
+# Rows of each multi row INSERT of the load_data fallback, so a chunk (the
+# whole DataFrame without chunk_size) stays under max_allowed_packet.
+INSERT_FALLBACK_ROWS = 1000
+
+
 class Mysql(Decorator):
+    async_driver = "mysql+aiomysql"
+    supports_stream_results = True
+    load_methods = Decorator.load_methods + ["load_data"]
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.is_valid = False
@@ -70,6 +85,11 @@ class Mysql(Decorator):
 
         return uri, is_valid, message
 
+    def get_async_param(self):
+        if self.config.get("local_infile", False):
+            return {"connect_args": {"local_infile": True}}
+        return {}
+
     def get_session(self, uri: str, param: dict = {}, description_encoding: bool = False):
         is_valid = False
         message = None
@@ -80,9 +100,86 @@ class Mysql(Decorator):
                 param = {}
                 description_encoding = None
 
+                if self.config.get("local_infile", False):
+                    param["connect_args"] = {"local_infile": True}
+
                 if uri:
                     super().get_session(uri, param, description_encoding)
             else:
                 raise ValueError(message)
 
         return self.session, is_valid, message
+
+    def get_load_method(self, load_method: str = None):
+        if load_method == "load_data":
+            return self.load_data_insert
+        return super().get_load_method(load_method=load_method)
+
+    @staticmethod
+    def _to_infile_value(value):
+        # Default LOAD DATA format: tab separated fields, newline terminated
+        # lines, backslash escapes and \N for NULL.
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "1" if value else "0"
+        value = str(value)
+        return (value.replace("\\", "\\\\")
+                .replace("\t", "\\t")
+                .replace("\n", "\\n")
+                .replace("\r", "\\r")
+                .replace("\0", "\\0"))
+
+    def load_data_insert(self, table, conn, keys, data_iter):
+        """pandas.DataFrame.to_sql insertion method which write each chunk to
+        a temporary file and load it with LOAD DATA LOCAL INFILE. Fall back to
+        multi row INSERT of INSERT_FALLBACK_ROWS rows if local_infile is
+        disabled on client or server.
+
+        Args:
+            table (pandas.io.sql.SQLTable): Table to load.
+            conn (sqlalchemy.engine.Connection): Connection of to_sql.
+            keys (list): Column names.
+            data_iter (iterable): Rows of the chunk.
+        """
+        from sqlalchemy import insert
+        from sqlalchemy.exc import DBAPIError
+
+        data = list(data_iter)
+
+        if self.config.get("local_infile", False):
+            preparer = conn.dialect.identifier_preparer
+            table_name = preparer.quote(table.name)
+            if table.schema:
+                table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+            columns = ", ".join(preparer.quote(key) for key in keys)
+
+            with tempfile.NamedTemporaryFile(mode="w",
+                                             suffix=".tsv",
+                                             encoding="utf-8",
+                                             newline="",
+                                             delete=False) as infile:
+                for row in data:
+                    infile.write("\t".join(self._to_infile_value(value)
+                                           for value in row))
+                    infile.write("\n")
+
+            try:
+                sql = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_name} "
+                       f"CHARACTER SET utf8mb4 ({columns})")
+                conn.exec_driver_sql(sql, (infile.name, ))
+                return
+            except DBAPIError as err:
+                if err.orig.args[0] not in LOCAL_INFILE_DISABLED_ERRORS:
+                    raise
+                logger.warning(
+                    "LOAD DATA LOCAL INFILE is disabled on the server. Fall back to multi row INSERT")
+            finally:
+                os.remove(infile.name)
+        else:
+            logger.warning(
+                "local_infile is not enabled in config. Fall back to multi row INSERT")
+
+        for start in range(0, len(data), INSERT_FALLBACK_ROWS):
+            conn.execute(insert(table.table).values([dict(zip(keys, row))
+                                                    for row in data[start:start + INSERT_FALLBACK_ROWS]]))
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 
+import io
 import logging
 import os
 from urllib.parse import quote_plus as urlquote
@@ -11,6 +12,10 @@ logger = logging.getLogger(__name__)
 
 
 class PostgreSQL(Decorator):
+    async_driver = "postgresql+asyncpg"
+    supports_stream_results = True
+    load_methods = Decorator.load_methods + ["copy"]
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.is_valid = False
@@ -86,3 +91,43 @@ class PostgreSQL(Decorator):
                 raise ValueError(message)
 
         return self.session, is_valid, message
+
+    def get_load_method(self, load_method: str = None):
+        if load_method == "copy":
+            return self.copy_insert
+        return super().get_load_method(load_method=load_method)
+
+    @staticmethod
+    def copy_insert(table, conn, keys, data_iter):
+        """pandas.DataFrame.to_sql insertion method which stream each chunk
+        as CSV through COPY FROM STDIN instead of INSERT statements.
+
+        Args:
+            table (pandas.io.sql.SQLTable): Table to load.
+            conn (sqlalchemy.engine.Connection): Connection of to_sql.
+            keys (list): Column names.
+            data_iter (iterable): Rows of the chunk.
+        """
+        def quote(value):
+            # Unquoted empty field is NULL in COPY CSV while quoted empty
+            # field is an empty string.
+            if value is None:
+                return ""
+            value = str(value).replace('"', '""')
+            return f'"{value}"'
+
+        buffer = io.StringIO()
+        for row in data_iter:
+            buffer.write(",".join(quote(value) for value in row))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        preparer = conn.dialect.identifier_preparer
+        table_name = preparer.quote(table.name)
+        if table.schema:
+            table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+        columns = ", ".join(preparer.quote(key) for key in keys)
+
+        sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        with conn.connection.cursor() as cursor:
+            cursor.copy_expert(sql=sql, file=buffer)
@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 
 
 class Redshift(Decorator):
+    async_driver = "postgresql+asyncpg"
+    supports_stream_results = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.is_valid = False
@@ -83,3 +86,6 @@ class Redshift(Decorator):
                 raise ValueError(message)
 
         return self.session, is_valid, message
+
+    def get_async_param(self):
+        return {"connect_args": {"ssl": "prefer"}}
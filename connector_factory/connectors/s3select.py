@@ -1,17 +1,123 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
-import pandas
+from typing import TYPE_CHECKING
 import os
 import io
+import re
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import botocore
 import json
 from ..decorator import Decorator
 
+if TYPE_CHECKING:
+    import pandas
+
 logger = logging.getLogger(__name__)
 
+# Objects selected concurrently if max_workers is not in config.
+DEFAULT_MAX_WORKERS = 8
+# Bytes of records parsed into one DataFrame if batch_size is not in config.
+DEFAULT_BATCH_SIZE = 8 * 1024 * 1024
+# Bytes of an uncompressed CSV or JSON LINES object selected by one request
+# if scan_range_size is not in config. Larger objects are split in ranges.
+DEFAULT_SCAN_RANGE_SIZE = 64 * 1024 * 1024
+# Seconds a listing of bucket and prefix is reused if listing_ttl is not in
+# config, 0 to list on every connection.
+DEFAULT_LISTING_TTL = 0
+# Parsed batches of one object waiting for the consumer.
+MAX_QUEUED_BATCHES = 2
+# Marker of the last batch of an object.
+END_OF_FILE = object()
+
+# Expressions accepted by S3 Select, a single SELECT over S3Object.
+SELECT_PATTERN = re.compile(r"^\s*SELECT\s+.+?\s+FROM\s+S3Object\b", re.IGNORECASE | re.DOTALL)
+UNSUPPORTED_PATTERN = re.compile(r"\b(GROUP\s+BY|ORDER\s+BY|HAVING|JOIN|UNION|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+LIMIT_PATTERN = re.compile(r"\bLIMIT\s+(\d+)\s*$", re.IGNORECASE)
+LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+
+# Listing of objects by (bucket, prefix, delimiter), shared by the connectors
+# of the process.
+LISTING_CACHE = {}
+LISTING_LOCK = threading.Lock()
+
+
+def invalidate_listing(bucket: str = None, prefix: str = None):
+    """
+    Remove cached listings of S3Select.
+
+    Args:
+        bucket: Bucket to remove, None for all buckets.
+        prefix: Prefix to remove, None for all prefixes of the bucket.
+    """
+    with LISTING_LOCK:
+        for key in list(LISTING_CACHE.keys()):
+            if (bucket is None or key[0] == bucket) and (prefix is None or key[1] == prefix):
+                LISTING_CACHE.pop(key, None)
+
+
+class RecordBuffer(object):
+    """
+    Buffer of the raw bytes of a S3 Select response.
+    ***********
+    Attributes:
+        delimiter: Record delimiter of the output serialization.
+        quote: Quote character of CSV output. A delimiter between quotes is
+            part of a field and is not a record boundary.
+    """
+
+    def __init__(self, delimiter: str = "\n", quote: str = None):
+        self.delimiter = delimiter.encode("utf-8")
+        self.quote = quote.encode("utf-8") if quote else None
+        self.buffer = bytearray()
+
+    def feed(self, data: bytes):
+        """
+        Add the payload of an event and return the complete records.
+
+        Args:
+            data: Payload of a Records event.
+
+        Returns:
+            Bytes of the complete records, empty if no record is complete.
+        """
+        self.buffer += data
+        end = self.__boundary()
+        if not end:
+            return b""
+
+        records = bytes(self.buffer[:end])
+        del self.buffer[:end]
+        return records
+
+    def flush(self):
+        """Return the last record which is not followed by a delimiter."""
+        records = bytes(self.buffer)
+        self.buffer.clear()
+        return records
+
+    def __boundary(self):
+        # Position after the last delimiter with an even number of quotes
+        # before it, 0 if the buffer has no complete record.
+        position = len(self.buffer)
+        quotes = self.buffer.count(self.quote) if self.quote else 0
+        while True:
+            index = self.buffer.rfind(self.delimiter, 0, position)
+            if index < 0:
+                return 0
+            if self.quote:
+                quotes -= self.buffer.count(self.quote, index, position)
+            if quotes % 2 == 0:
+                return index + len(self.delimiter)
+            position = index
+
 
 class S3Select(Decorator):
     def __init__(self, config: dict):
@@ -20,6 +126,7 @@ class S3Select(Decorator):
         self.aws = None
         self.aws_session = None
         self.files = []
+        self.file_metadata = {}
 
     def validate_config(self):
         super().validate_config()
@@ -27,12 +134,11 @@ class S3Select(Decorator):
         message = ""
 
         if not self.is_valid:
-            import botocore
-
             bucket = self.config.get("bucket", None)
             file = self.config.get("file", None)
             file_type = self.config.get("type", None)
             compression = self.config.get("compression", None)
+            json_type = self.config.get("json_type", None)
             record_delimiter = self.config.get("record_delimiter", None)
             field_delimiter = self.config.get("field_delimiter", None)
             region = self.config.get("region", None)
@@ -56,6 +162,11 @@ class S3Select(Decorator):
                 self.is_valid = False
                 logger.error(message)
 
+            if json_type and json_type.upper() not in ["DOCUMENT", "LINES"]:
+                message = f"Invalid JSON type, valid values are DOCUMENT or LINES.{os.linesep}"
+                self.is_valid = False
+                logger.error(message)
+
             if not compression:
                 message = f"{message}Compression type is not provided. Will not use any compression.{os.linesep}"
 
@@ -80,6 +191,8 @@ class S3Select(Decorator):
         raise ValueError(f"Unsupported method for AWS")
 
     def validate_files(self):
+        import botocore
+
         bucket = self.config.get("bucket", None)
         file = self.config.get("file", None)
         file_type = self.config.get("type", None)
@@ -87,10 +200,13 @@ class S3Select(Decorator):
         suffix = Path(file).suffix
         if suffix:
             try:
-                self.session.head_object(Bucket=bucket, Key=file)
+                response = self.session.head_object(Bucket=bucket, Key=file)
 
                 # self.session.Object(bucket, file).load()
                 self.files.append(f"{file}")
+                self.file_metadata[file] = {"Size": response.get("ContentLength"),
+                                            "ETag": response.get("ETag"),
+                                            "LastModified": response.get("LastModified")}
                 self.is_valid = True
                 message = ""
             except botocore.exceptions.ClientError as e:
@@ -107,15 +223,14 @@ class S3Select(Decorator):
                 logger.error(message)
         else:
             file_list = []
-            files_in_folder = self.session.list_objects_v2(Bucket=bucket,
-                                                           Prefix=file)
-            for content in files_in_folder.get('Contents', []):
+            for content in self.list_objects(bucket=bucket, prefix=file):
                 key = content.get("Key")
                 suffix = Path(key).suffix.lower()
                 if suffix in [f".{file_type.lower()}"]:
                     logger.info(
                         f"File found for the S3Select as {key}")
                     file_list.append(key)
+                    self.file_metadata[key] = content
 
             if not file_list:
                 self.is_valid = False
@@ -123,6 +238,72 @@ class S3Select(Decorator):
             else:
                 self.files = file_list
 
+    def list_objects(self, bucket: str, prefix: str):
+        """
+        List all objects of the prefix with Key, Size, ETag and LastModified.
+
+        Every page of list_objects_v2 is read. If list_delimiter is in
+        config, sub-prefixes of the delimiter are listed concurrently. If
+        listing_ttl is in config, the listing is cached by bucket, prefix and
+        delimiter for listing_ttl seconds. Objects of a cached listing have
+        Cached True, their size is checked with head_object before it is used.
+
+        Args:
+            bucket: Name of the bucket.
+            prefix: Prefix of the keys.
+
+        Returns:
+            List of dictionary of objects sorted by Key.
+        """
+        ttl = float(self.config.get("listing_ttl", DEFAULT_LISTING_TTL))
+        delimiter = self.config.get("list_delimiter", None)
+        key = (bucket, prefix, delimiter)
+
+        if ttl > 0:
+            with LISTING_LOCK:
+                expire_at, objects = LISTING_CACHE.get(key, (0, None))
+            if objects is not None and expire_at > time.monotonic():
+                logger.info(f"Use cached listing of {len(objects)} objects for {bucket}/{prefix}")
+                return [{**content, "Cached": True} for content in objects]
+
+        if delimiter:
+            contents, prefixes = self.__list_pages(bucket=bucket, prefix=prefix, delimiter=delimiter)
+            max_workers = max(int(self.config.get("max_workers", DEFAULT_MAX_WORKERS)), 1)
+            with ThreadPoolExecutor(max_workers=max_workers,
+                                    thread_name_prefix="s3select-list") as executor:
+                for sub_contents, _ in executor.map(lambda sub_prefix: self.__list_pages(bucket=bucket, prefix=sub_prefix),
+                                                    prefixes):
+                    contents += sub_contents
+            contents.sort(key=lambda content: content.get("Key"))
+        else:
+            contents, _ = self.__list_pages(bucket=bucket, prefix=prefix)
+
+        objects = [{"Key": content.get("Key"),
+                    "Size": content.get("Size"),
+                    "ETag": content.get("ETag"),
+                    "LastModified": content.get("LastModified")} for content in contents]
+        logger.info(f"Listed {len(objects)} objects for {bucket}/{prefix}")
+
+        if ttl > 0:
+            with LISTING_LOCK:
+                LISTING_CACHE[key] = (time.monotonic() + ttl, objects)
+
+        return objects
+
+    def __list_pages(self, bucket: str, prefix: str, delimiter: str = None):
+        param = {"Bucket": bucket, "Prefix": prefix}
+        if delimiter:
+            param["Delimiter"] = delimiter
+
+        contents = []
+        prefixes = []
+        paginator = self.session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**param):
+            contents += page.get("Contents", [])
+            prefixes += [common_prefix.get("Prefix") for common_prefix in page.get("CommonPrefixes", [])]
+
+        return contents, prefixes
+
     def get_session(self, uri: str, param: dict = {}, description_encoding: bool = False):
         is_valid = True
         message = None
@@ -139,42 +320,171 @@ class S3Select(Decorator):
                 from .aws import Aws
                 self.aws = Aws(self.config)
                 self.aws_session, is_valid, message = self.aws.get_session()
-                self.session = self.aws_session.client("s3")
+                from botocore.config import Config
+
+                # Connection pool of the shared client is sized for the workers.
+                max_workers = max(int(self.config.get("max_workers", DEFAULT_MAX_WORKERS)), 1)
+                self.session = self.aws_session.client("s3",
+                                                       config=Config(max_pool_connections=max(max_workers, 10)))
 
                 self.validate_files()
 
         logger.info("S3Select will return the object of boto3 S3 client")
         return self.session, is_valid, message
 
-    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append"):
+    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append", load_method: str = None):
+        raise ValueError(f"Unsupported method for S3Select")
+
+    def transaction(self):
+        raise ValueError(f"Unsupported method for S3Select")
+
+    def get_partition_queries(self, sql: str, partition_on: str = None, num_partitions: int = None, lower_bound=None, upper_bound=None, predicates: list = None):
         raise ValueError(f"Unsupported method for S3Select")
 
-    def execute_sql(self, sql: str = None):
+    def execute_sql(self, sql: str = None, params=None):
         logger.info(f"Got SQL statement to execute: {sql}")
         logger.info("Only select queries can be executed")
 
-        df = self.get_df(sql=None)
+        if params is not None:
+            raise ValueError(f"Bind parameters are not supported for S3Select")
+
+        df = self.get_df(sql=sql)
         rows = df.to_records().tolist()
 
         return rows
 
     def get_df(self, sql: str = None, chunk_size: int = None):
-        bucket = self.config.get("bucket", None)
-        file = self.config.get("file", None)
+        with self.instrument("get_df", sql) as event:
+            df = self.__query_df(sql=sql)
+            if event is not None:
+                event.add(df)
+        return df
+
+    def __query_df(self, sql: str = None):
+        import pandas
+
+        # Batches are parsed while the objects are streamed, chunk_size
+        # only changes the size of the frames of iter_df.
+        df_list = list(self.__iter_batches(sql=sql))
+        if df_list:
+            return pandas.concat(df_list, ignore_index=True).reset_index(drop=True)
+        return pandas.DataFrame()
+
+    def iter_df(self, sql: str = None, chunk_size: int = None):
+        if not chunk_size or chunk_size < 1:
+            msg = f"Invalid chunk size {chunk_size}. Chunk size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        # Invalid expression is reported before the first chunk is requested
+        if sql:
+            self.validate_sql(sql)
+
+        return self._instrument_stream(operation="iter_df",
+                                       sql=sql,
+                                       items=self.__iter_chunks(sql=sql, chunk_size=chunk_size))
+
+    def validate_sql(self, sql: str):
+        """
+        Validate a S3 Select expression pushed down to every object.
+
+        Only a single SELECT ... FROM S3Object is supported, with projection,
+        WHERE and LIMIT. LIMIT is applied to every object and to the
+        cumulative number of records.
+
+        Args:
+            sql: S3 Select expression.
+
+        Returns:
+            Tuple of expression without trailing ';' and its limit or None.
+        """
+        query = sql.strip().rstrip(";").strip()
+        # String literals are not checked for keywords
+        unquoted = LITERAL_PATTERN.sub("''", query)
+
+        message = None
+        if ";" in unquoted:
+            message = "Only a single statement is supported by S3Select"
+        elif not SELECT_PATTERN.match(unquoted):
+            message = "Only SELECT ... FROM S3Object statements are supported by S3Select"
+        else:
+            unsupported = UNSUPPORTED_PATTERN.search(unquoted)
+            if unsupported:
+                message = f"{' '.join(unsupported.group(1).upper().split())} is not supported by S3Select"
+
+        if message:
+            msg = f"Invalid S3Select statement '{sql}'. {message}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        limit = LIMIT_PATTERN.search(unquoted)
+        return query, int(limit.group(1)) if limit else None
+
+    def __iter_chunks(self, sql: str, chunk_size: int):
+        import pandas
+
+        # Batches are cut at record boundaries of the response, they are
+        # regrouped so every chunk except the last one has chunk_size rows.
+        frames = []
+        row_count = 0
+        for df_batch in self.__iter_batches(sql=sql):
+            frames.append(df_batch)
+            row_count += len(df_batch)
+
+            while row_count >= chunk_size:
+                df = frames[0] if len(frames) == 1 else pandas.concat(frames, ignore_index=True)
+                yield df.iloc[:chunk_size].reset_index(drop=True)
+                frames = [df.iloc[chunk_size:]]
+                row_count = len(frames[0])
+
+        if row_count:
+            df = frames[0] if len(frames) == 1 else pandas.concat(frames, ignore_index=True)
+            yield df.reset_index(drop=True)
+
+    def __get_select_config(self, sql: str = None):
         file_type = self.config.get("type", None)
         compression = self.config.get("compression", "NONE")
         compression = compression.upper()
         record_delimiter = self.config.get("record_delimiter", "\n")
         field_delimiter = self.config.get("field_delimiter", ",")
         limit = self.config.get("limit", None)
+        limit = int(limit) if limit else None
+        json_type = self.config.get("json_type", "DOCUMENT").upper()
+
+        if sql:
+            query, sql_limit = self.validate_sql(sql)
+            if sql_limit is None and limit:
+                query = f"{query} LIMIT {limit}"
+            elif sql_limit is not None:
+                limit = min(sql_limit, limit) if limit else sql_limit
+        else:
+            limit_str = ""
+            if limit:
+                limit_str = f"LIMIT {limit}"
 
-        limit_str = ""
-        if limit:
-            limit_str = f"LIMIT {limit}"
+            # specify the SQL query to select a random sample of data from the file
+            query = f"SELECT * FROM S3Object {limit_str}"
 
-        # specify the SQL query to select a random sample of data from the file
-        query = f"SELECT * FROM S3Object {limit_str}"
-        if file_type.lower() == "csv":
+        if file_type.lower() == "csv" and sql:
+            # Columns are referenced by the names of the header and records
+            # are returned as JSON to keep the names.
+            select_object_content_config = {
+                "InputSerialization": {
+                    "CSV": {
+                        "FileHeaderInfo": "USE",
+                        "RecordDelimiter": record_delimiter,
+                        "FieldDelimiter": field_delimiter
+                    },
+                    "CompressionType": compression
+                },
+                "OutputSerialization": {
+                    "JSON": {
+                        "RecordDelimiter": "\n"
+                    }
+                },
+                "record_format": "csv_records"
+            }
+        elif file_type.lower() == "csv":
             select_object_content_config = {
                 "InputSerialization": {
                     "CSV": {
@@ -189,21 +499,24 @@ class S3Select(Decorator):
                         "RecordDelimiter": record_delimiter,
                         "FieldDelimiter": field_delimiter
                     }
-                }
+                },
+                "record_format": "csv"
             }
         elif file_type.lower() == "json":
             select_object_content_config = {
                 "InputSerialization": {
                     "JSON": {
-                        "Type": "DOCUMENT"
+                        "Type": json_type
                     },
                     "CompressionType": compression
                 },
                 "OutputSerialization": {
                     "JSON": {
-                        "RecordDelimiter": ","
+                        "RecordDelimiter": "\n"
                     }
-                }
+                },
+                # SELECT * returns the whole document as one record
+                "record_format": "json" if sql or json_type == "LINES" else "document"
             }
         elif file_type.lower() == "parquet":
             select_object_content_config = {
@@ -213,93 +526,312 @@ class S3Select(Decorator):
                 },
                 "OutputSerialization": {
                     "JSON": {
-                        "RecordDelimiter": ","
+                        "RecordDelimiter": "\n"
                     }
-                }
+                },
+                "record_format": "json"
             }
         else:
             raise ValueError(
                 "Invalid file type, Valid values if CSV, JSON or Parquet")
 
-        df_list = []
+        return query, select_object_content_config, limit
+
+    def __iter_select(self, file: str, query: str, select_object_content_config: dict, scan_range: dict = None, stop: threading.Event = None):
+        """
+        Select one object and yield DataFrames while the response is streamed.
+
+        Raw bytes of the Records events are accumulated in a buffer and only
+        complete records are parsed, so a record split over two events is
+        never decoded partially. A DataFrame is yielded each time batch_size
+        bytes of records are received.
+
+        Args:
+            file: Key of the object.
+            query: SQL expression of S3 Select.
+            select_object_content_config: Input and output serialization.
+            scan_range: Start and End (inclusive) bytes of the object, records
+                starting in the range are selected. Only the first range of a
+                CSV object has the header, the other ranges have numbered columns.
+            stop: Event to stop reading the response.
+
+        Returns:
+            Generator of DataFrame.
+        """
+        bucket = self.config.get("bucket", None)
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
+        end_event_received = False
+
+        output_serialization = select_object_content_config['OutputSerialization']
+        if "CSV" in output_serialization:
+            delimiter = output_serialization["CSV"]["RecordDelimiter"]
+            quote = '"'
+        else:
+            delimiter = output_serialization["JSON"]["RecordDelimiter"]
+            quote = None
+        buffer = RecordBuffer(delimiter=delimiter, quote=quote)
+
+        param = {}
+        if scan_range:
+            param["ScanRange"] = scan_range
+        header = not scan_range or scan_range["Start"] == 0
+
+        # Response with data
+        response = self.session.select_object_content(
+            Bucket=bucket,
+            Key=file,
+            Expression=query,
+            ExpressionType="SQL",
+            InputSerialization=select_object_content_config['InputSerialization'],
+            OutputSerialization=output_serialization,
+            **param
+        )
+
+        payload = response['Payload']
+        record_format = select_object_content_config.get("record_format", "csv")
+        columns = None
+        records = []
+        records_size = 0
+        try:
+            for event in payload:
+                if stop is not None and stop.is_set():
+                    return
+
+                if 'Records' in event:
+                    data = buffer.feed(event['Records']['Payload'])
+                    if data:
+                        records.append(data)
+                        records_size += len(data)
+
+                    if records_size >= batch_size:
+                        df, columns = self.__parse_records(b"".join(records), record_format, columns, header)
+                        records = []
+                        records_size = 0
+                        yield df
+                # End event indicates that the request finished successfully
+                elif 'End' in event:
+                    end_event_received = True
+        finally:
+            if hasattr(payload, "close"):
+                payload.close()
+
+        if not end_event_received:
+            raise Exception(
+                "End event not received, request incomplete.")
+
+        data = buffer.flush()
+        if data:
+            records.append(data)
+
+        if records:
+            df, columns = self.__parse_records(b"".join(records), record_format, columns, header)
+            yield df
+
+    def __parse_records(self, records: bytes, record_format: str, columns: list = None, header: bool = True):
+        """
+        Parse complete records of a response into DataFrame.
+
+        Args:
+            records: Complete records of the response.
+            record_format: One of csv, csv_records, json or document.
+            columns: Header of the object for the CSV records after the first batch.
+            header: First CSV record of the response is the header.
+
+        Returns:
+            Tuple of DataFrame and columns.
+        """
+        import pandas
+
+        if record_format == "csv":
+            field_delimiter = self.config.get("field_delimiter", ",")
+            # First line of the object is the header
+            if header and columns is None:
+                df_tmp = pandas.read_csv(io.BytesIO(records),
+                                         header=0,
+                                         sep=field_delimiter)
+                columns = list(df_tmp.columns)
+            else:
+                df_tmp = pandas.read_csv(io.BytesIO(records),
+                                         header=None,
+                                         names=columns,
+                                         sep=field_delimiter)
+        elif record_format == "csv_records":
+            # Values of CSV are strings, numbers are inferred as by read_csv
+            df_tmp = pandas.read_json(io.BytesIO(records), lines=True, dtype=False)
+            for column in df_tmp.columns:
+                if df_tmp[column].dtype == object:
+                    try:
+                        values = df_tmp[column]
+                        df_tmp[column] = pandas.to_numeric(values.where(values != ""))
+                    except (ValueError, TypeError):
+                        pass
+        elif record_format == "json":
+            df_tmp = pandas.read_json(io.BytesIO(records), lines=True)
+        else:
+            # Every record is a document with lists of rows
+            new_records = []
+            for line in records.splitlines():
+                if line.strip():
+                    for k, v in json.loads(line).items():
+                        new_records += v
+
+            df_tmp = pandas.read_json(io.StringIO(json.dumps(new_records)))
+
+        return df_tmp.reset_index(drop=True), columns
+
+    def __select_to_queue(self, file: str, query: str, select_object_content_config: dict, scan_range: dict, output: queue.Queue, stop: threading.Event):
+        try:
+            for df_tmp in self.__iter_select(file, query, select_object_content_config, scan_range, stop):
+                if not self.__put(output, df_tmp, stop):
+                    return
+            item = END_OF_FILE
+        except Exception as err:
+            item = err
+
+        self.__put(output, item, stop)
+
+    @staticmethod
+    def __put(output: queue.Queue, item, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def __iter_ranges(self, select_object_content_config: dict):
+        """
+        Split the objects in ScanRange of scan_range_size bytes.
+
+        Only uncompressed CSV and JSON LINES objects are split, S3 Select
+        returns the records starting in the range so every record is
+        selected once. Sizes come from the listing or head_object.
+
+        Args:
+            select_object_content_config: Input and output serialization.
+
+        Returns:
+            Generator of tuple of file and scan range or None.
+        """
+        scan_range_size = int(self.config.get("scan_range_size", DEFAULT_SCAN_RANGE_SIZE))
+        input_serialization = select_object_content_config['InputSerialization']
+        splittable = bool(scan_range_size > 0
+                          and input_serialization.get("CompressionType", "NONE") == "NONE"
+                          and select_object_content_config.get("record_format") in ["csv", "json"]
+                          and ("CSV" in input_serialization
+                               or input_serialization.get("JSON", {}).get("Type") == "LINES"))
+
+        for file in self.files:
+            size = None
+            if splittable:
+                metadata = self.file_metadata.get(file, {})
+                size = metadata.get("Size")
+                # Size of a cached listing may be stale, ranges past it would
+                # drop the records appended since the listing.
+                if size is None or metadata.get("Cached"):
+                    bucket = self.config.get("bucket", None)
+                    response = self.session.head_object(Bucket=bucket, Key=file)
+                    if metadata.get("ETag") and metadata.get("ETag") != response.get("ETag"):
+                        logger.info(f"{file} changed since it was listed, use its current size")
+                    self.file_metadata[file] = {"Key": file,
+                                                "Size": response.get("ContentLength"),
+                                                "ETag": response.get("ETag"),
+                                                "LastModified": response.get("LastModified")}
+                    size = self.file_metadata[file]["Size"]
+
+            if not size or size <= scan_range_size:
+                yield file, None
+                continue
+
+            logger.info(f"Select {file} of {size} bytes in ranges of {scan_range_size} bytes")
+            for start in range(0, size, scan_range_size):
+                yield file, {"Start": start, "End": min(start + scan_range_size, size) - 1}
+
+    def __iter_batches(self, sql: str = None):
+        max_workers = max(int(self.config.get("max_workers", DEFAULT_MAX_WORKERS)), 1)
+        query, select_object_content_config, limit = self.__get_select_config(sql=sql)
+
         total_row_count = 0
         check_limit = False
 
         if limit:
             check_limit = True
 
-        for file in self.files:
-            header = 0
-            end_event_received = False
-
-            if not check_limit or total_row_count < limit:
-                # Response with data
-                response = self.session.select_object_content(
-                    Bucket=bucket,
-                    Key=file,
-                    Expression=query,
-                    ExpressionType="SQL",
-                    InputSerialization=select_object_content_config['InputSerialization'],
-                    OutputSerialization=select_object_content_config['OutputSerialization']
-                )
-
-                records = ""
-                for event in response['Payload']:
-                    if 'Records' in event:
-                        records += event['Records']['Payload'].decode("utf-8")
-                    # elif 'Stats' in event:
-                    #     statsDetails = event['Stats']['Details']
-                    #     print("Stats details bytesScanned: ")
-                    #     print(statsDetails['BytesScanned'])
-                    #     print("Stats details bytesProcessed: ")
-                    #     print(statsDetails['BytesProcessed'])
-                    #     print("Stats details bytesReturned: ")
-                    #     print(statsDetails['BytesReturned'])
-                    # elif 'Progress' in event:
-                    #     print(event['Progress']['Details'])
-                    # End event indicates that the request finished successfully
-                    elif 'End' in event:
-                        # print('Result is complete')
-                        end_event_received = True
-
-                if not end_event_received:
-                    raise Exception(
-                        "End event not received, request incomplete.")
-
-                if file_type.lower() in ["json", "parquet"]:
-                    if records.endswith(","):
-                        records = records[:-1]
-
-                    if file_type.lower() in ["parquet"]:
-                        records = f"[{records}]"
-
-                    records = json.loads(records)
-                    new_records = []
-
-                    if file_type.lower() in ["parquet"]:
-                        new_records = records
-                    else:
-                        for k, v in records.items():
-                            new_records += v
-
-                    df_tmp = pandas.read_json(
-                        json.dumps(new_records)).reset_index(drop=True)
-                elif file_type.lower() in ["csv"]:
-                    df_tmp = pandas.read_csv(io.StringIO(records),
-                                             header=header).reset_index(drop=True)
-
-                if check_limit:
-                    total_row_count += len(df_tmp)
-
-                    # check total row count against threshold
-                    if total_row_count > limit:
-                        rows_to_extract = total_row_count - limit
-                        df_tmp = df_tmp.head(len(df_tmp) - rows_to_extract)
-
-                df_list.append(df_tmp)
-
-        df = pandas.concat(df_list, ignore_index=True).reset_index(drop=True)
-        return df
+        # Objects are selected concurrently, batches are yielded in order of
+        # the files. Every object writes its batches to a bounded queue, so
+        # the workers ahead of the consumer wait instead of holding whole
+        # objects in memory. Only a window of max_workers objects ahead of
+        # the consumer is scheduled and the workers are stopped once the
+        # limit is reached or the consumer stops. Ranges of a large object
+        # are scheduled like objects and reassembled in order.
+        files = self.__iter_ranges(select_object_content_config)
+        pending = deque()
+        stop = threading.Event()
+        columns = None
+
+        def submit(file: str, scan_range: dict):
+            output = queue.Queue(maxsize=MAX_QUEUED_BATCHES)
+            future = executor.submit(self.__select_to_queue,
+                                     file,
+                                     query,
+                                     select_object_content_config,
+                                     scan_range,
+                                     output,
+                                     stop)
+            pending.append((future, output, scan_range))
+
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="s3select") as executor:
+            try:
+                for file, scan_range in itertools.islice(files, max_workers * 2):
+                    submit(file, scan_range)
+
+                while pending:
+                    future, output, scan_range = pending[0]
+                    while True:
+                        df_tmp = output.get()
+                        if df_tmp is END_OF_FILE:
+                            break
+                        if isinstance(df_tmp, Exception):
+                            raise df_tmp
+
+                        # Header of CSV is in the first range of the object
+                        if not scan_range or scan_range["Start"] == 0:
+                            columns = df_tmp.columns
+                        elif select_object_content_config.get("record_format") == "csv":
+                            df_tmp.columns = columns
+
+                        if check_limit:
+                            total_row_count += len(df_tmp)
+
+                            # check total row count against threshold
+                            if total_row_count >= limit:
+                                rows_to_extract = total_row_count - limit
+                                df_tmp = df_tmp.head(len(df_tmp) - rows_to_extract)
+                                logger.info(
+                                    f"Limit of {limit} records is reached, cancel the remaining files")
+                                yield df_tmp
+                                return
+
+                        yield df_tmp
+
+                    pending.popleft()
+                    for file, scan_range in itertools.islice(files, 1):
+                        submit(file, scan_range)
+            finally:
+                stop.set()
+                for future, output, scan_range in pending:
+                    future.cancel()
+
+    def _iter_arrow_batches(self, sql: str = None, batch_size: int = None):
+        if batch_size:
+            if sql:
+                self.validate_sql(sql)
+            frames = self.__iter_chunks(sql=sql, chunk_size=batch_size)
+        else:
+            frames = [self.__query_df(sql=sql)]
+        return self._iter_arrow_batches_from_df(frames=frames)
 
     def destroy(self):
         try:
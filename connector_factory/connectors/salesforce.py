@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 import os
-import pandas
 from requests.exceptions import ConnectionError
 
 from ..decorator import Decorator
 
+if TYPE_CHECKING:
+    import pandas
+
 logger = logging.getLogger(__name__)
 
 # https://github.com/simple-salesforce/simple-salesforce
@@ -140,63 +144,147 @@ class Salesforce(Decorator):
             i += 1
         return " ".join(soql_lst)
 
-    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append"):
+    def execute_df(self, panda_df: pandas.DataFrame, table_name: str, chunk_size: int = None, exist_action: str = "append", load_method: str = None):
         # return super().execute_df(panda_df, table_name, chunk_size, exist_action)
         raise ValueError(f"Unsupported method for Salesforce")
         pass
 
-    def execute_sql(self, sql: str):
+    def transaction(self):
+        raise ValueError(f"Unsupported method for Salesforce")
+
+    def get_partition_queries(self, sql: str, partition_on: str = None, num_partitions: int = None, lower_bound=None, upper_bound=None, predicates: list = None):
+        raise ValueError(f"Unsupported method for Salesforce")
+
+    def execute_sql(self, sql: str, params=None):
         logger.info(f"Got SQL statement to execute: {sql}")
         logger.info("Only select queries can be executed")
 
+        if params is not None:
+            raise ValueError(f"Bind parameters are not supported for Salesforce")
+
         df = self.get_df(sql=sql)
         rows = df.to_records().tolist()
         return rows
 
-    def get_df(self, sql: str, chunk_size: int = None):
+    def __prepare_query(self, sql: str):
         logger.info(f"Got SQL statement to execute: {sql}")
         logger.info("Only select queries can be executed")
 
         soql_lower = sql.lower()
 
-        if soql_lower.startswith("select"):
-            if "FIELDS(CUSTOM)".lower() in soql_lower or "FIELDS(ALL)".lower() in soql_lower:
-                columns = self.get_columns(soql=sql)
-                sql = self.replace_columns(soql=sql, columns=columns)
+        if not soql_lower.startswith("select"):
+            raise ValueError(
+                "Invalid sql statement. Only query is supported in Salesforce using select statement.")
 
-            message = None
+        columns = None
+        if "FIELDS(CUSTOM)".lower() in soql_lower or "FIELDS(ALL)".lower() in soql_lower:
+            columns = self.get_columns(soql=sql)
+            sql = self.replace_columns(soql=sql, columns=columns)
 
-            if not self.session:
-                _, _, message = self.get_session(None)
+        message = None
 
-            if not self.session:
-                raise ValueError(message)
+        if not self.session:
+            _, _, message = self.get_session(None)
+
+        if not self.session:
+            raise ValueError(message)
+
+        return sql, columns
 
-            df = None
+    def __reconnect(self):
+        # Try to handle the timeout with new connection.
+        from simple_salesforce import Salesforce as SimpleSaleforce
+        self.session = SimpleSaleforce(instance=self.session.sf_instance,
+                                       session_id=self.session.session_id)
+
+    def __records_to_df(self, records: list, columns: list = None):
+        import pandas
+
+        df = pandas.DataFrame(records)
+        if "attributes" in df.columns:
+            df.drop(["attributes"], axis=1, inplace=True)
+        df = pandas.json_normalize(df.to_dict(orient="records"))
+        if columns:
             try:
-                result = self.session.query_all(query=sql)
-            except ConnectionError:
-                # Try to handle the timeout with new connection.
-                from simple_salesforce import Salesforce as SimpleSaleforce
-                self.session = SimpleSaleforce(instance=self.session.sf_instance,
-                                               session_id=self.session.session_id)
-                # Attempt your request again here...
-                result = self.session.query_all(query=sql)
-
-            if result and "records" in result:
-                df = pandas.DataFrame(result["records"])
-                if "attributes" in df.columns:
-                    df.drop(["attributes"], axis=1, inplace=True)
-                df = pandas.json_normalize(df.to_dict(orient="records"))
-                try:
-                    df = df[columns].copy(deep=True)
-                except:
-                    pass
-
-            return df
-
-        raise ValueError(
-            "Invalid sql statement. Only query is supported in Salesforce using select statement.")
+                df = df[columns].copy(deep=True)
+            except:
+                pass
+        return df
+
+    def get_df(self, sql: str, chunk_size: int = None):
+        sql, columns = self.__prepare_query(sql=sql)
+
+        with self.instrument("get_df", sql) as event:
+            df = self.__query_df(sql=sql, columns=columns)
+
+            if event is not None:
+                event.add(df)
+
+        return df
+
+    def __query_df(self, sql: str, columns: list = None):
+        df = None
+        try:
+            result = self.session.query_all(query=sql)
+        except ConnectionError:
+            self.__reconnect()
+            # Attempt your request again here...
+            result = self.session.query_all(query=sql)
+
+        if result and "records" in result:
+            df = self.__records_to_df(records=result["records"],
+                                      columns=columns)
+        return df
+
+    def iter_df(self, sql: str, chunk_size: int):
+        if not chunk_size or chunk_size < 1:
+            msg = f"Invalid chunk size {chunk_size}. Chunk size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        sql, columns = self.__prepare_query(sql=sql)
+        return self._instrument_stream(operation="iter_df",
+                                       sql=sql,
+                                       items=self.__iter_chunks(sql=sql,
+                                                                chunk_size=chunk_size,
+                                                                columns=columns))
+
+    def __iter_chunks(self, sql: str, chunk_size: int, columns: list = None):
+        # query_all_iter follows nextRecordsUrl page by page, so only the
+        # current page and the pending chunk are kept in memory.
+        records = []
+        for record in self.__iter_records(sql=sql):
+            records.append(record)
+            if len(records) >= chunk_size:
+                yield self.__records_to_df(records=records, columns=columns)
+                records = []
+
+        if records:
+            yield self.__records_to_df(records=records, columns=columns)
+
+    def __iter_records(self, sql: str):
+        # Reconnect and retry as get_df does. Once records are returned the
+        # query is not restarted, it would return them again.
+        received = 0
+        try:
+            for record in self.session.query_all_iter(query=sql):
+                received += 1
+                yield record
+        except ConnectionError:
+            if received:
+                raise
+            self.__reconnect()
+            yield from self.session.query_all_iter(query=sql)
+
+    def _iter_arrow_batches(self, sql: str = None, batch_size: int = None):
+        sql, columns = self.__prepare_query(sql=sql)
+        if batch_size:
+            frames = self.__iter_chunks(sql=sql,
+                                        chunk_size=batch_size,
+                                        columns=columns)
+        else:
+            frames = [self.__query_df(sql=sql, columns=columns)]
+        return self._iter_arrow_batches_from_df(frames=frames)
 
     def destroy(self):
         pass
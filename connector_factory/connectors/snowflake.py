@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 import os
 from urllib.parse import quote_plus as urlquote
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
 
 from ..decorator import Decorator
 
+if TYPE_CHECKING:
+    import pandas
+
 logger = logging.getLogger(__name__)
 
 
 class Snowflake(Decorator):
+    load_methods = Decorator.load_methods + ["stage"]
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.is_valid = False
@@ -138,6 +143,9 @@ class Snowflake(Decorator):
                     password = password.encode()
 
                 if key:
+                    from cryptography.hazmat.backends import default_backend
+                    from cryptography.hazmat.primitives import serialization
+
                     with open(key, "rb") as c_key:
                         p_key = serialization.load_pem_private_key(
                             c_key.read(),
@@ -157,3 +165,110 @@ class Snowflake(Decorator):
                 raise ValueError(message)
 
         return self.session, is_valid, message
+
+    def execute_df(self,
+                   panda_df: pandas.DataFrame,
+                   table_name: str,
+                   chunk_size: int = None,
+                   exist_action: str = "append",
+                   load_method: str = None):
+        if load_method != "stage":
+            return super().execute_df(panda_df=panda_df,
+                                      table_name=table_name,
+                                      chunk_size=chunk_size,
+                                      exist_action=exist_action,
+                                      load_method=load_method)
+
+        logger.info(
+            f"Got pandas dataframe to stage and copy into table {table_name}")
+        message = None
+
+        # write_pandas runs on its own connection and commits, it can not be
+        # part of the transaction block.
+        if self.in_transaction():
+            msg = f"Load method stage is not supported inside transaction"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if not self.session:
+            _, _, message = self.get_session(None)
+
+        if not self.session:
+            raise ValueError(message)
+
+        if not len(panda_df):
+            msg = f"Invalid DataFrame"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if exist_action not in ["append", "replace", "fail"]:
+            msg = f"Invalid exist action {exist_action}. Valid values are append, replace or fail"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if exist_action == "fail":
+            from sqlalchemy import inspect
+            if inspect(self.session.bind).has_table(table_name):
+                msg = f"Table '{table_name}' already exists."
+                logger.error(msg)
+                raise ValueError(msg)
+
+        from snowflake.connector.pandas_tools import write_pandas
+
+        parallel = self.config.get("parallel", 4)
+        logger.info(
+            f"Table name: {table_name} and action on table is already present: {exist_action}")
+        logger.info(
+            f"Chunk size of staged parquet files: {chunk_size} and parallel upload threads: {parallel}")
+
+        # write_pandas write the chunks as compressed Parquet files, PUT them
+        # to a temporary stage in parallel and load them with single COPY INTO.
+        connection = self.session.bind.raw_connection()
+        with self.instrument("execute_df", table_name) as event:
+            try:
+                success, num_chunks, num_rows, _ = write_pandas(conn=connection.driver_connection,
+                                                                df=panda_df,
+                                                                table_name=table_name,
+                                                                chunk_size=chunk_size,
+                                                                compression="gzip",
+                                                                parallel=parallel,
+                                                                quote_identifiers=False,
+                                                                auto_create_table=True,
+                                                                overwrite=exist_action == "replace",
+                                                                use_logical_type=True)
+                connection.commit()
+            finally:
+                connection.close()
+
+            if event is not None:
+                event.add(panda_df)
+
+        if not success:
+            msg = f"Failed to copy staged DataFrame into table {table_name}"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        logger.info(f"Loaded {num_rows} rows from {num_chunks} staged files")
+
+    def _iter_arrow_batches(self, sql: str, batch_size: int = None):
+        # Snowflake connector download result chunks as Arrow natively, use
+        # the DBAPI cursor directly to avoid the row by row conversion.
+        connection = self.session.bind.raw_connection()
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(sql)
+                columns = [column[0] for column in cursor.description or []]
+                is_empty = True
+
+                for table in cursor.fetch_arrow_batches():
+                    for batch in table.to_batches(max_chunksize=batch_size):
+                        is_empty = False
+                        yield batch
+
+                if is_empty:
+                    yield self._empty_arrow_batch(columns=columns)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
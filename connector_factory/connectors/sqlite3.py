@@ -9,8 +9,42 @@ from ..decorator import Decorator
 
 logger = logging.getLogger(__name__)
 
+# Performance profiles applied as PRAGMA on every new connection. Values of
+# "pragmas" in config override the values of the selected profile.
+PERFORMANCE_PROFILES = {
+    "default": {},
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64000,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY"
+    },
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -256000,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY"
+    }
+}
+
+SUPPORTED_PRAGMAS = ["journal_mode",
+                     "synchronous",
+                     "cache_size",
+                     "mmap_size",
+                     "temp_store",
+                     "busy_timeout",
+                     "foreign_keys",
+                     "locking_mode",
+                     "page_size",
+                     "wal_autocheckpoint"]
+
 
 class Sqlite3(Decorator):
+    async_driver = "sqlite+aiosqlite"
+    load_methods = Decorator.load_methods + ["executemany"]
+
     def __init__(self, config: dict):
         path = config.get("path", None)
         if not path:
@@ -38,6 +72,14 @@ class Sqlite3(Decorator):
                 self.is_valid = False
                 logger.error(message)
 
+            try:
+                self.get_pragmas()
+            except ValueError as err:
+                message = f"{message}{str(err)}{os.linesep}"
+                self.is_valid = False
+                logger.error(message)
+                return self.is_valid, message
+
             if ".db" not in database:
                 database = f"{database}.db"
 
@@ -89,3 +131,97 @@ class Sqlite3(Decorator):
                 super().get_session(uri, param, description_encoding)
 
         return self.session, is_valid, message
+
+    def get_pragmas(self):
+        """Return PRAGMA name and value of the configured performance profile
+        merged with the pragmas of config.
+
+        Raises:
+            ValueError: Invalid profile, pragma name or value.
+
+        Returns:
+            pragmas: Dictonary of PRAGMA name and value.
+        """
+        profile = self.config.get("profile", "default")
+        if profile not in PERFORMANCE_PROFILES:
+            raise ValueError(
+                f"Invalid profile {profile}. Valid values are {list(PERFORMANCE_PROFILES.keys())}")
+
+        pragmas = {**PERFORMANCE_PROFILES[profile],
+                   **self.config.get("pragmas", {})}
+
+        for name, value in pragmas.items():
+            if name.lower() not in SUPPORTED_PRAGMAS:
+                raise ValueError(
+                    f"Invalid pragma {name}. Valid values are {SUPPORTED_PRAGMAS}")
+            if not isinstance(value, int) and not str(value).isalnum():
+                raise ValueError(f"Invalid value {value} for pragma {name}")
+
+        return pragmas
+
+    def engine_options(self):
+        return {"pragmas": self.get_pragmas()}
+
+    def configure_engine(self, engine):
+        pragmas = self.get_pragmas()
+        if not pragmas:
+            return
+
+        from sqlalchemy import event
+
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name} = {value}")
+            finally:
+                cursor.close()
+
+        logger.info(f"Sqlite3 connections will be created with pragmas {pragmas}")
+        event.listen(engine, "connect", set_pragmas)
+
+    def get_load_method(self, load_method: str = None):
+        if load_method == "executemany":
+            return self.executemany_insert
+        return super().get_load_method(load_method=load_method)
+
+    @staticmethod
+    def executemany_insert(table, conn, keys, data_iter):
+        """pandas.DataFrame.to_sql insertion method which insert each chunk
+        with executemany of sqlite3 cursor, bypassing the SQLAlchemy statement
+        execution. to_sql run all chunks in single transaction.
+
+        Args:
+            table (pandas.io.sql.SQLTable): Table to load.
+            conn (sqlalchemy.engine.Connection): Connection of to_sql.
+            keys (list): Column names.
+            data_iter (iterable): Rows of the chunk.
+        """
+        preparer = conn.dialect.identifier_preparer
+        table_name = preparer.quote(table.name)
+        if table.schema:
+            table_name = f"{preparer.quote_schema(table.schema)}.{table_name}"
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        values = ", ".join("?" for _ in keys)
+
+        # Store datetime in the same format as SQLAlchemy DateTime of SQLite.
+        datetime_index = [i for i, key in enumerate(keys)
+                          if key in table.frame.columns
+                          and table.frame[key].dtype.kind == "M"]
+
+        def adapt(row):
+            row = list(row)
+            for i in datetime_index:
+                if row[i] is not None:
+                    row[i] = row[i].strftime("%Y-%m-%d %H:%M:%S.%f")
+            return row
+
+        if datetime_index:
+            data_iter = map(adapt, data_iter)
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.executemany(
+                f"INSERT INTO {table_name} ({columns}) VALUES ({values})", data_iter)
+        finally:
+            cursor.close()
@@ -9,6 +9,10 @@ logger = logging.getLogger(__name__)
 
 
 class Synapse(Decorator):
+    # SQL Server accepts at most 2100 parameters and 1000 rows per INSERT.
+    max_bind_params = 2099
+    max_multi_rows = 1000
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.is_valid = False
@@ -114,6 +118,11 @@ class Synapse(Decorator):
                 param = {}
                 description_encoding = None
 
+                # Send executemany parameters as arrays in one ODBC call
+                # instead of one round trip per row.
+                param["fast_executemany"] = self.config.get("fast_executemany",
+                                                            True)
+
                 if uri:
                     super().get_session(uri, param, description_encoding)
             else:
@@ -1,26 +1,88 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
+import itertools
+import threading
 from abc import ABC, abstractmethod
-import pandas
+import contextlib
+from contextlib import contextmanager
+from functools import lru_cache
 import atexit
-from sqlalchemy import text
+
+from .instrumentation import instrument, phase
+
+if TYPE_CHECKING:
+    import pandas
 
 
 logger = logging.getLogger(__name__)
 
+# Config keys forwarded to create_engine to tune the connection pool.
+POOL_PARAMS = ["pool_size",
+               "max_overflow",
+               "pool_timeout",
+               "pool_recycle",
+               "pool_pre_ping",
+               "pool_use_lifo"]
+
+# Pool classes accepted by pool_class config key. Only QueuePool accept the
+# sizing parameters.
+POOL_CLASSES = ["QueuePool", "NullPool", "StaticPool"]
+POOL_SIZING_PARAMS = ["pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"]
+
+
+@lru_cache(maxsize=512)
+def get_statement(sql: str):
+    """Return cached SQLAlchemy TextClause of the sql. Same statement object
+    is reused for repeated sql, so bind parameters are parsed once and the
+    SQLAlchemy compiled cache is hit on every execution.
+
+    Args:
+        sql (str): Plain DDL or DML query with optional :name bind parameters.
+
+    Returns:
+        statement: sqlalchemy.sql.expression.TextClause
+    """
+    from sqlalchemy import text
+
+    return text(sql)
+
 
 class Decorator(ABC):
 
+    # Connectors whose driver supports server side cursors (named cursors on
+    # psycopg2, SSCursor on pymysql) set this to stream chunked reads by default.
+    supports_stream_results = False
+
+    # SQLAlchemy drivername of asyncio driver used by AsyncConnectorFactory.
+    # Connectors without async driver are run in thread.
+    async_driver = None
+
+    # Values accepted by load_method of execute_df. Connectors with bulk
+    # loading extend this list and override get_load_method.
+    load_methods = ["insert", "multi"]
+
+    # Limits of the database for single multi row INSERT statement. When set,
+    # chunk size of load method multi is reduced to stay under the limits.
+    max_bind_params = None
+    max_multi_rows = None
+
     @abstractmethod
     def __init__(self, config: dict) -> None:
         super().__init__()
         self.config = config
         self.engine = None
+        self.engine_key = None
         self.session = None
         self.engine_type = config.get("connection_type", None)
         self.debug = config.get("debug", False)
+        self.stream_results = config.get("stream_results",
+                                         self.supports_stream_results)
+        # Transaction depth is kept per thread like the scoped session.
+        self._transaction = threading.local()
         pass
 
     @abstractmethod
@@ -42,7 +104,13 @@ class Decorator(ABC):
             if (self.session):
                 self.session.close()
                 self.session.remove()
-                self.engine.dispose(close=True)
+                if self.engine_key:
+                    # Shared engine stay open in registry for reuse.
+                    from .registry import ENGINE_REGISTRY
+                    ENGINE_REGISTRY.release(self.engine_key)
+                    self.engine_key = None
+                else:
+                    self.engine.dispose(close=True)
                 self.session = None
                 self.engine = None
                 logger.info("Successfully dispose the connection")
@@ -68,17 +136,36 @@ class Decorator(ABC):
         from sqlalchemy import create_engine
         from sqlalchemy.orm import scoped_session
         from sqlalchemy.orm import sessionmaker
+
+        if not self.session:
+            param = {**(param or {}), **self.get_pool_param()}
+
         try:
             if not self.session:
                 logger.info(f"Creating SQLAlchemy Dialects session scope.")
-                if param:
-                    self.engine = create_engine(uri, echo=self.debug, **param)
-                else:
-                    self.engine = create_engine(uri, echo=self.debug)
 
-                if description_encoding:
-                    # https: // github.com/sqlalchemy/sqlalchemy/issues/5645
-                    self.engine.dialect.description_encoding = None
+                def create():
+                    if param:
+                        engine = create_engine(uri, echo=self.debug, **param)
+                    else:
+                        engine = create_engine(uri, echo=self.debug)
+
+                    if description_encoding:
+                        # https: // github.com/sqlalchemy/sqlalchemy/issues/5645
+                        engine.dialect.description_encoding = None
+
+                    self.configure_engine(engine)
+                    return engine
+
+                if self.config.get("shared_engine", False):
+                    from .registry import ENGINE_REGISTRY
+                    self.engine_key, self.engine = ENGINE_REGISTRY.acquire(uri=uri,
+                                                                           param={**param,
+                                                                                  "echo": self.debug,
+                                                                                  "engine_options": self.engine_options()},
+                                                                           create=create)
+                else:
+                    self.engine = create()
 
                 self.session = scoped_session(sessionmaker(bind=self.engine,
                                                            expire_on_commit=False))
@@ -89,20 +176,129 @@ class Decorator(ABC):
             return self.session
         except Exception as err:
             message = f"Failed to create session with given paramaters for Database"
-            logger.exception(message, err)
+            logger.exception(message)
             raise ValueError(message)
 
-    # @abstractmethod
-    def execute_sql(self, sql: str):
-        """Function to execute DML or DDL queries and return if rows exist.
+    def get_pool_param(self):
+        """Build the connection pool parameters of create_engine from config
+        keys pool_class, pool_size, max_overflow, pool_timeout, pool_recycle,
+        pool_pre_ping and pool_use_lifo.
+
+        Raises:
+            ValueError: Invalid pool class or parameters for the pool class.
+
+        Returns:
+            param: Dictonary of create_engine parameters.
+        """
+        param = {key: self.config[key]
+                 for key in POOL_PARAMS if self.config.get(key) is not None}
+
+        pool_class = self.config.get("pool_class", None)
+        if pool_class:
+            if pool_class not in POOL_CLASSES:
+                msg = f"Invalid pool class {pool_class}. Valid values are {POOL_CLASSES}"
+                logger.error(msg)
+                raise ValueError(msg)
+
+            invalid = [key for key in POOL_SIZING_PARAMS if key in param]
+            if pool_class != "QueuePool" and invalid:
+                msg = f"Pool parameters {invalid} are not supported by {pool_class}"
+                logger.error(msg)
+                raise ValueError(msg)
+
+            import sqlalchemy.pool
+            param["poolclass"] = getattr(sqlalchemy.pool, pool_class)
+
+        if param:
+            logger.info(f"Connection pool parameters: {list(param.keys())}")
+        return param
+
+    def get_max_workers(self):
+        """Maximum number of queries the connector can run concurrently, used
+        to bound the worker threads of get_df_many and execute_many. For
+        QueuePool it is pool_size + max_overflow so workers never wait for a
+        connection of the pool.
+
+        Returns:
+            max_workers: Number of workers or None if not limited.
+        """
+        from sqlalchemy.pool import QueuePool
+
+        pool = self.engine.pool if self.engine is not None else None
+        if isinstance(pool, QueuePool) and pool._max_overflow >= 0:
+            return pool.size() + pool._max_overflow
+        return None
+
+    def release_session(self):
+        """Remove the scoped session of the current thread so its connection
+        is returned to the pool. Called by worker threads once done.
+        """
+        if self.session is not None and self.engine is not None:
+            self.session.remove()
+
+    def get_async_param(self):
+        """Additional parameters of create_async_engine for the async driver.
+        Connectors override this method for driver specific connect_args.
+        Parameters of the synchronous engine built in get_session are not
+        passed to the async driver, the ones it supports are returned here.
+
+        Returns:
+            param: Dictonary of create_async_engine parameters.
+        """
+        return {}
+
+    def configure_engine(self, engine):
+        """Hook called once the SQLAlchemy engine is created, before the first
+        connection is opened. Connectors override this method to register
+        engine events like connect listeners.
 
         Args:
-            sql (str): (Required) => Plain DDL or DML query to execute on Database. Default is None. One of paramater sql_query or panda_df is required. If both is provided panda_df will be taken as priority and sql_query is ignored.
+            engine (sqlalchemy.engine.Engine): Newly created engine.
+        """
+        pass
+
+    def engine_options(self):
+        """Return the config used by configure_engine. It is part of the key
+        of shared engines, so connectors with different engine setup do not
+        share an engine.
 
         Returns:
-            rows: If rows in case of DML select queries else none.
+            options: Dictonary of engine options.
+        """
+        return {}
+
+    def instrument(self, operation: str, sql: str = None):
+        """Return context manager measuring the call for the query listeners.
+        It yields QueryEvent to add rows, bytes and phases, or None if no
+        listener is registered and debug is off. In debug mode duration and
+        phases of the call are logged and, if profile_dir is in config, the
+        call is profiled with cProfile.
+
+        Args:
+            operation (str): Method of the connector like get_df.
+            sql (str, optional): Query of the call. Defaults to None.
+
+        Returns:
+            context: Context manager yielding QueryEvent or None.
+        """
+        return instrument(connector_type=self.engine_type,
+                          operation=operation,
+                          sql=sql,
+                          debug=self.debug,
+                          profile_dir=self.config.get("profile_dir", None))
+
+    @contextmanager
+    def transaction(self):
+        """Context manager to run execute_sql, execute_df and get_df calls in
+        single transaction. Commit is deferred to the exit of the outermost
+        block and the transaction is rolled back if the block raise error.
+
+        Raises:
+            ValueError: Failed to create session.
+
+        Yields:
+            self: Connector object.
         """
-        logger.info(f"Got SQL statement to execute: {sql}")
         message = None
 
         if not self.session:
@@ -111,21 +307,124 @@ class Decorator(ABC):
         if not self.session:
             raise ValueError(message)
 
+        depth = getattr(self._transaction, "depth", 0)
+        self._transaction.depth = depth + 1
+        try:
+            yield self
+        except Exception:
+            if depth == 0:
+                logger.error("Rollback the transaction due to error")
+                self.session.rollback()
+            raise
+        else:
+            if depth == 0:
+                self.session.commit()
+        finally:
+            self._transaction.depth = depth
+
+    def in_transaction(self):
+        """Return True if called inside transaction block of current thread."""
+        return getattr(self._transaction, "depth", 0) > 0
+
+    @contextmanager
+    def _connect(self, stream_size: int = None):
+        """Yield connection to read the results. Inside transaction block the
+        connection of the session is used so uncommitted writes are visible.
+        """
+        if self.in_transaction():
+            yield self.session.connection()
+            return
+
+        with self.session.bind.connect() as connection:
+            if stream_size and self.stream_results:
+                # Server side cursor keeps the result on the database and
+                # fetch only stream_size rows per round trip, so the first
+                # rows are returned without buffering the complete result.
+                logger.info(
+                    f"Using server side cursor to stream rows in size of {stream_size}")
+                # SQLAlchemy 1.4 returns a copy of the connection with the
+                # options, 2.0 sets them in place and returns the same one.
+                connection = connection.execution_options(stream_results=True,
+                                                          max_row_buffer=stream_size)
+            yield connection
+
+    # @abstractmethod
+    def execute_sql(self, sql: str, params=None):
+        """Function to execute DML or DDL queries and return if rows exist.
+
+        Args:
+            sql (str): (Required) => Plain DDL or DML query to execute on Database. Default is None. One of paramater sql_query or panda_df is required. If both is provided panda_df will be taken as priority and sql_query is ignored.
+            params (dict | list, optional): (Optional) => Values of :name bind parameters in sql. Dictonary executes the statement once and list of dictonary executes it as executemany. Defaults to None.
+
+        Returns:
+            rows: If rows in case of DML select queries else none.
+        """
+        logger.info(f"Got SQL statement to execute: {sql}")
+        message = None
+
+        if params is not None and not isinstance(params, (dict, list)):
+            msg = f"Invalid params. Params should be dictonary or list of dictonary"
+            logger.error(msg)
+            raise ValueError(msg)
+
         rows = None
 
-        result = self.session.execute(text(sql))
-        if result.returns_rows:
-            rows = result.fetchall()
-        else:
-            self.session.commit()
+        if isinstance(params, list) and not params:
+            return rows
+
+        with self.instrument("execute_sql", sql) as event:
+            with phase(event, "connect"):
+                if not self.session:
+                    _, _, message = self.get_session(None)
+
+                if not self.session:
+                    raise ValueError(message)
+
+            with phase(event, "execute"):
+                result = self.session.execute(get_statement(sql), params)
+
+            if result.returns_rows:
+                with phase(event, "fetch"):
+                    rows = result.fetchall()
+
+            # Writes returning rows (INSERT ... RETURNING) are committed too.
+            if not self.in_transaction():
+                with phase(event, "commit"):
+                    self.session.commit()
+
+            if event is not None:
+                event.add(rows=len(rows) if rows is not None else max(result.rowcount, 0))
         return rows
 
+    def get_load_method(self, load_method: str = None):
+        """Resolve load_method of execute_df to the method argument of
+        pandas.DataFrame.to_sql.
+
+        Args:
+            load_method (str, optional): One of load_methods. Defaults to None which is insert.
+
+        Raises:
+            ValueError: Load method is not supported by the connector.
+
+        Returns:
+            method: None, "multi" or callable(table, conn, keys, data_iter)
+        """
+        if load_method in [None, "insert"]:
+            return None
+        elif load_method == "multi":
+            return "multi"
+
+        msg = f"Invalid load method {load_method}. Valid values are {self.load_methods}"
+        logger.error(msg)
+        raise ValueError(msg)
+
     # @abstractmethod
     def execute_df(self,
                    panda_df: pandas.DataFrame,
                    table_name: str,
                    chunk_size: int = None,
-                   exist_action: str = "append"):
+                   exist_action: str = "append",
+                   load_method: str = None):
         """
         Function to execute Pandas DataFrame object to create, replace or
         append table with DataFrame table objects.
@@ -147,6 +446,12 @@ class Decorator(ABC):
             exist_action:   (Optional) => Action on if table already exist.
                             Default: append mode. Others modes are replace
                             or fail.
+            load_method:    (Optional) => How rows are sent to the database.
+                            insert uses executemany of INSERT statement,
+                            multi uses multi row INSERT statement and bulk
+                            load methods depend on the connector, like copy
+                            for PostgreSQL.
+                            Default: insert.
         *******
         Return:
         -------
@@ -163,19 +468,45 @@ class Decorator(ABC):
         if not self.session:
             raise ValueError(message)
 
+        method = self.get_load_method(load_method=load_method)
+
+        if method == "multi" and self.max_bind_params and len(panda_df.columns):
+            max_rows = max(self.max_bind_params // len(panda_df.columns), 1)
+            if self.max_multi_rows:
+                max_rows = min(max_rows, self.max_multi_rows)
+
+            if not chunk_size or chunk_size > max_rows:
+                logger.info(
+                    f"Chunk size {chunk_size} is reduced to {max_rows} to stay under {self.max_bind_params} parameters per statement")
+                chunk_size = max_rows
+
         if len(panda_df):
             logger.info(
                 f"Got Pandas DataFrame. This will be used to insert data in table.")
             logger.info(
                 f"Table name: {table_name} and action on table is already present: {exist_action}")
             logger.info(f"Chunk size to insert data is: {chunk_size}")
-
-            panda_df.to_sql(name=table_name,
-                            con=self.session.bind,
-                            if_exists=exist_action,
-                            chunksize=chunk_size,
-                            index=False)
-            self.session.commit()
+            logger.info(f"Load method to insert data is: {load_method}")
+
+            if self.in_transaction():
+                con = self.session.connection()
+            else:
+                con = self.session.bind
+
+            with self.instrument("execute_df", table_name) as event:
+                with phase(event, "write"):
+                    panda_df.to_sql(name=table_name,
+                                    con=con,
+                                    if_exists=exist_action,
+                                    chunksize=chunk_size,
+                                    index=False,
+                                    method=method)
+                if not self.in_transaction():
+                    with phase(event, "commit"):
+                        self.session.commit()
+
+                if event is not None:
+                    event.add(panda_df)
         else:
             msg = f"Invalid DataFrame"
             logger.error(msg)
@@ -211,21 +542,465 @@ class Decorator(ABC):
         logger.info(f"Return pandas dataframe of a output from sql {sql}")
         message = None
 
+        import pandas
+
+        with self.instrument("get_df", sql) as event:
+            with phase(event, "connect"):
+                if not self.session:
+                    _, _, message = self.get_session(None)
+
+                if not self.session:
+                    raise ValueError(message)
+
+            if chunk_size:
+                chunks = list(self._read_sql_chunks(sql=sql,
+                                                    chunk_size=chunk_size,
+                                                    event=event))
+                with phase(event, "concat"):
+                    df = pandas.concat(chunks).reset_index(drop=True)
+            elif self.debug:
+                df = list(self._read_sql_phases(sql=sql, event=event))[0]
+            else:
+                with self._connect() as connection:
+                    df = pandas.read_sql(sql=sql, con=connection)
+
+            if event is not None:
+                event.add(df)
+        return df
+
+    # @abstractmethod
+    def iter_df(self,
+                sql: str,
+                chunk_size: int):
+        """
+        Function to execute DML select queries and lazily yield Pandas
+        DataFrame chunks. Only one chunk is held in memory at a time, so
+        large results can be processed with constant memory.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            chunk_size:     (Required) => Number of rows to include in each
+                            chunk.
+        *******
+        Return:
+        -------
+
+            generator:      Generator of Pandas DataFrame chunks.
+        """
+        logger.info(f"Stream pandas dataframe chunks of a output from sql {sql}")
+        message = None
+
+        if not chunk_size or chunk_size < 1:
+            msg = f"Invalid chunk size {chunk_size}. Chunk size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
         if not self.session:
             _, _, message = self.get_session(None)
 
         if not self.session:
             raise ValueError(message)
 
-        if chunk_size:
-            chunks_df = []
+        return self._stream_df(sql=sql, chunk_size=chunk_size)
+
+    def _stream_df(self, sql: str, chunk_size: int):
+        with self.instrument("iter_df", sql) as event:
+            for chunk in self._read_sql_chunks(sql=sql,
+                                               chunk_size=chunk_size,
+                                               event=event):
+                if event is not None:
+                    event.add(chunk)
+                yield chunk
+
+    def _instrument_stream(self, operation: str, sql: str, items):
+        """Yield items of DataFrame chunks or record batches while measuring
+        the stream as single call for the query listeners."""
+        with self.instrument(operation, sql) as event:
+            for item in items:
+                if event is not None:
+                    event.add(item)
+                yield item
+
+    def get_partition_queries(self,
+                              sql: str,
+                              partition_on: str = None,
+                              num_partitions: int = None,
+                              lower_bound=None,
+                              upper_bound=None,
+                              predicates: list = None):
+        """Split the select query in range partitions of partition_on column
+        or in one query per predicate. Rows with NULL partition_on and rows
+        outside of the bounds are read by the first or last partition.
+
+        Args:
+            sql (str): (Required) => Plain DML select query to partition.
+            partition_on (str, optional): (Optional) => Numeric, date or datetime column to partition the query on. Defaults to None.
+            num_partitions (int, optional): (Optional) => Number of range partitions. Defaults to None.
+            lower_bound (optional): (Optional) => Lower bound of partition_on. Defaults to None to query MIN of the column.
+            upper_bound (optional): (Optional) => Upper bound of partition_on. Defaults to None to query MAX of the column.
+            predicates (list, optional): (Optional) => List of WHERE conditions, one per partition. Takes priority over partition_on. Defaults to None.
+
+        Raises:
+            ValueError: Invalid partition parameters.
+
+        Returns:
+            queries: List of select queries of the partitions.
+        """
+        sql = sql.strip().rstrip(";")
+
+        if predicates:
+            return [f"SELECT * FROM ({sql}) partition_source WHERE {predicate}"
+                    for predicate in predicates]
+
+        if not partition_on or not num_partitions or num_partitions < 1:
+            msg = f"Invalid partition. partition_on and positive num_partitions are required"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if lower_bound is None or upper_bound is None:
+            rows = self.execute_sql(
+                sql=f"SELECT MIN({partition_on}), MAX({partition_on}) FROM ({sql}) partition_source")
+            lower_bound = rows[0][0] if lower_bound is None else lower_bound
+            upper_bound = rows[0][1] if upper_bound is None else upper_bound
+
+        if lower_bound is None or upper_bound is None:
+            # Table is empty or column has only NULL values.
+            return [sql]
+
+        lower_bound = self._partition_bound(lower_bound)
+        upper_bound = self._partition_bound(upper_bound)
+        boundaries = self._partition_boundaries(lower=lower_bound,
+                                                upper=upper_bound,
+                                                num_partitions=num_partitions)
+        if not boundaries:
+            return [sql]
+
+        predicates = []
+        for index, boundary in enumerate(boundaries):
+            condition = f"{partition_on} < {self._partition_literal(boundary)}"
+            if index == 0:
+                condition = f"({condition} OR {partition_on} IS NULL)"
+            else:
+                condition = f"{partition_on} >= {self._partition_literal(boundaries[index - 1])} AND {condition}"
+            predicates.append(condition)
+        predicates.append(
+            f"{partition_on} >= {self._partition_literal(boundaries[-1])}")
+
+        logger.info(
+            f"Partitioned query on {partition_on} in {len(predicates)} partitions")
+        return [f"SELECT * FROM ({sql}) partition_source WHERE {predicate}"
+                for predicate in predicates]
+
+    @staticmethod
+    def _partition_boundaries(lower, upper, num_partitions: int):
+        """Return the num_partitions - 1 inner boundaries between lower and
+        upper bound. Integer bounds give integer boundaries without duplicates.
+        """
+        if isinstance(lower, int) and isinstance(upper, int):
+            step = -(-(upper - lower + 1) // num_partitions)
+            return [lower + step * index for index in range(1, num_partitions)
+                    if lower + step * index <= upper]
+
+        if lower >= upper:
+            return []
+        return [lower + (upper - lower) * index / num_partitions
+                for index in range(1, num_partitions)]
+
+    @staticmethod
+    def _partition_bound(value):
+        """Parse ISO date or datetime strings, as returned by MIN and MAX of
+        date columns stored as text (Sqlite), to date or datetime.
+        """
+        import datetime
+
+        if not isinstance(value, str):
+            return value
+
+        try:
+            parsed = datetime.datetime.fromisoformat(value.strip())
+        except ValueError:
+            msg = f"Invalid partition bound {value}. Bounds should be numeric, date or datetime"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if len(value.strip()) == 10:
+            return parsed.date()
+        return parsed
+
+    @staticmethod
+    def _partition_literal(value):
+        import datetime
+        import numbers
+
+        if isinstance(value, datetime.datetime):
+            return f"'{value.isoformat(sep=' ')}'"
+        if isinstance(value, datetime.date):
+            return f"'{value.isoformat()}'"
+        if isinstance(value, numbers.Number) and not isinstance(value, bool):
+            return str(value)
+
+        msg = f"Invalid partition bound {value}. Bounds should be numeric, date or datetime"
+        logger.error(msg)
+        raise ValueError(msg)
+
+    def _read_sql_chunks(self, sql: str, chunk_size: int, event=None):
+        if self.debug:
+            yield from self._read_sql_phases(sql=sql,
+                                             chunk_size=chunk_size,
+                                             event=event)
+            return
+
+        import pandas
+
+        with self._connect(stream_size=chunk_size) as connection:
             for chunk in pandas.read_sql(sql=sql,
-                                         con=self.session.bind,
+                                         con=connection,
                                          chunksize=chunk_size):
-                chunks_df.append(chunk)
-            df = pandas.concat(list(chunks_df)).reset_index(drop=True)
-        else:
-            df = pandas.read_sql(sql=sql,
-                                 con=self.session.bind,
-                                 chunksize=chunk_size)
-        return df
+                yield chunk
+
+    def _read_sql_phases(self, sql: str, chunk_size: int = None, event=None):
+        """Debug mode version of pandas.read_sql which times the connect,
+        execute, fetch and DataFrame convert phases separately. Yields one
+        DataFrame, or one per chunk_size rows, like pandas.read_sql.
+        """
+        import pandas
+
+        with contextlib.ExitStack() as stack:
+            with phase(event, "connect"):
+                connection = stack.enter_context(self._connect(stream_size=chunk_size))
+
+            with phase(event, "execute"):
+                result = connection.exec_driver_sql(sql)
+            columns = list(result.keys())
+
+            empty = True
+            while True:
+                with phase(event, "fetch"):
+                    rows = result.fetchmany(chunk_size) if chunk_size else result.fetchall()
+
+                if not rows and not empty:
+                    break
+
+                with phase(event, "convert"):
+                    df = pandas.DataFrame.from_records(rows,
+                                                       columns=columns,
+                                                       coerce_float=True)
+                empty = False
+                yield df
+
+                if not chunk_size or not rows:
+                    break
+
+    # @abstractmethod
+    def get_arrow(self,
+                  sql: str,
+                  batch_size: int = None):
+        """
+        Function to execute DML select queries and return the result as
+        Apache Arrow data without going through Pandas DataFrame.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            batch_size:     (Optional) => If specified, return a streaming
+                            pyarrow.RecordBatchReader where batch_size is the
+                            number of rows fetched for each record batch.
+                            Column types are inferred from the first batch,
+                            batches are held while a column has only NULL
+                            values until its type is known.
+                            Default: None to return a pyarrow.Table with all
+                            records.
+        *******
+        Return:
+        -------
+
+            table:          pyarrow.Table or pyarrow.RecordBatchReader if
+                            batch_size is given.
+        """
+        import pyarrow
+
+        logger.info(f"Return arrow data of a output from sql {sql}")
+        message = None
+
+        if batch_size is not None and batch_size < 1:
+            msg = f"Invalid batch size {batch_size}. Batch size should be positive integer"
+            logger.error(msg)
+            raise ValueError(msg)
+
+        if not self.session:
+            _, _, message = self.get_session(None)
+
+        if not self.session:
+            raise ValueError(message)
+
+        if batch_size:
+            batches = self._instrument_stream(operation="get_arrow",
+                                              sql=sql,
+                                              items=self._unify_arrow_batches(
+                                                  self._iter_arrow_batches(sql=sql,
+                                                                           batch_size=batch_size)))
+            first = next(batches)
+            return pyarrow.RecordBatchReader.from_batches(first.schema,
+                                                          itertools.chain([first], batches))
+
+        with self.instrument("get_arrow", sql) as event:
+            table = pyarrow.Table.from_batches(list(self._unify_arrow_batches(self._iter_arrow_batches(sql=sql))))
+            if event is not None:
+                event.add(table)
+        return table
+
+    # @abstractmethod
+    def get_polars(self,
+                   sql: str,
+                   batch_size: int = None):
+        """
+        Function to execute DML select queries and return Polars DataFrame
+        object built on top of get_arrow.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            batch_size:     (Optional) => Number of rows fetched from the
+                            database per round trip.
+                            Default: None to fetch all records at once.
+        *******
+        Return:
+        -------
+
+            df:             Polars DataFrame.
+        """
+        import polars
+
+        table = self.get_arrow(sql=sql, batch_size=batch_size)
+        if batch_size:
+            table = table.read_all()
+        return polars.from_arrow(table)
+
+    def _iter_arrow_batches(self, sql: str, batch_size: int = None):
+        """Yield pyarrow.RecordBatch objects for the query. At least one batch
+        is always yielded so the schema is known even for empty results.
+        Connectors with native Arrow fetch override this method.
+        """
+        import pyarrow
+
+        with self._connect(stream_size=batch_size) as connection:
+            result = connection.execute(get_statement(sql))
+            columns = list(result.keys())
+            # Type of each column once a batch has a value, None to infer.
+            types = None
+
+            while True:
+                if batch_size:
+                    rows = result.fetchmany(batch_size)
+                else:
+                    rows = result.fetchall()
+
+                if not rows and types is not None:
+                    break
+
+                # Transpose the rows so each column is converted in one call.
+                if rows:
+                    values = list(zip(*rows))
+                else:
+                    values = [[] for _ in columns]
+
+                if types is None:
+                    types = [None for _ in columns]
+                arrays = [pyarrow.array(value, type=column_type)
+                          for value, column_type in zip(values, types)]
+                batch = pyarrow.RecordBatch.from_arrays(arrays,
+                                                        names=columns)
+                types = [None if pyarrow.types.is_null(field.type) else field.type
+                         for field in batch.schema]
+                yield batch
+
+                if not batch_size:
+                    break
+
+    def _iter_arrow_batches_from_df(self, frames):
+        """Fallback for connectors which only produce Pandas DataFrame. Frames
+        are read without get_df or iter_df, so get_arrow is reported once."""
+        import pyarrow
+
+        schema = None
+        empty = True
+        for df in frames:
+            if df is None:
+                continue
+            batch = pyarrow.RecordBatch.from_pandas(df,
+                                                    schema=schema,
+                                                    preserve_index=False)
+            # Schema of a batch with NULL only columns is not reused, the
+            # batches are unified by _unify_arrow_batches.
+            if not any(pyarrow.types.is_null(field.type) for field in batch.schema):
+                schema = batch.schema
+            empty = False
+            yield batch
+
+        if empty:
+            yield self._empty_arrow_batch(columns=[])
+
+    @staticmethod
+    def _unify_arrow_batches(batches):
+        """Yield the record batches with a single schema. A column with only
+        NULL values has Arrow type null, so batches are held until the type
+        of every column is known from a later batch, or the stream ends, and
+        are cast to the unified schema.
+        """
+        import pyarrow
+
+        def cast(batch, schema):
+            if batch.schema.equals(schema):
+                return batch
+            return pyarrow.RecordBatch.from_arrays([column.cast(field.type)
+                                                    for column, field in zip(batch.columns, schema)],
+                                                   schema=schema)
+
+        def unify(items):
+            # Type of a column is the first one which is not null, columns
+            # are matched by position as names may repeat.
+            fields = []
+            for index, field in enumerate(items[0].schema):
+                types = [item.schema.field(index).type for item in items
+                         if not pyarrow.types.is_null(item.schema.field(index).type)]
+                fields.append(field.with_type(types[0]) if types else field)
+            return pyarrow.schema(fields)
+
+        pending = []
+        schema = None
+        for batch in batches:
+            if schema is not None:
+                yield cast(batch, schema)
+                continue
+
+            pending.append(batch)
+            unified = unify(pending)
+            if any(pyarrow.types.is_null(field.type) for field in unified):
+                continue
+
+            schema = unified
+            for item in pending:
+                yield cast(item, schema)
+            pending = []
+
+        if pending:
+            schema = unify(pending)
+            for item in pending:
+                yield cast(item, schema)
+
+    @staticmethod
+    def _empty_arrow_batch(columns: list):
+        import pyarrow
+
+        arrays = [pyarrow.array([], type=pyarrow.null()) for _ in columns]
+        return pyarrow.RecordBatch.from_arrays(arrays, names=columns)
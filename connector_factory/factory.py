@@ -6,30 +6,114 @@ multiple databases using the configuration parameters.
 URI of database handled automatically for multiple databases using SQLAlchemy
 """
 
+from __future__ import annotations
+
 import os
 import logging
-import pandas
+import time
+import importlib
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from .common.common import Common
+
+if TYPE_CHECKING:
+    import pandas
 
 
 logger = logging.getLogger(__name__)
 
-SUPPORTED_ENGINE = ["postgre",
-                    "mysql",
-                    "mariadb",
-                    "snowflake",
-                    "redshift",
-                    "sqlite",
-                    "salesforce",
-                    "s3select"
-                    "aws",
-                    "databricks",
-                    "synapse",
-                    "db2",
-                    "dynamodb"
-                    ]
+# Connectors are resolved lazily from "module:Class", so only the module of
+# the requested connector and its dependencies are imported.
+CONNECTORS = {"postgre": "connector_factory.connectors.postgreSQL:PostgreSQL",
+              "mysql": "connector_factory.connectors.mysql:Mysql",
+              "mariadb": "connector_factory.connectors.mysql:Mysql",
+              "snowflake": "connector_factory.connectors.snowflake:Snowflake",
+              "redshift": "connector_factory.connectors.redshift:Redshift",
+              "sqlite": "connector_factory.connectors.sqlite3:Sqlite3",
+              "salesforce": "connector_factory.connectors.salesforce:Salesforce",
+              "s3select": "connector_factory.connectors.s3select:S3Select",
+              "aws": "connector_factory.connectors.aws:Aws",
+              "databricks": "connector_factory.connectors.databricks:Databricks",
+              "synapse": "connector_factory.connectors.synapse:Synapse",
+              "db2": "connector_factory.connectors.db2:Db2",
+              "dynamodb": "connector_factory.connectors.dynamodb:DynamoDb"
+              }
+
+SUPPORTED_ENGINE = list(CONNECTORS.keys())
+
+# Entry point group of third party connectors. Name of the entry point is the
+# connector type and value is the Decorator subclass, like
+# "mydb = mypackage.connector:MyDb".
+ENTRY_POINT_GROUP = "connector_factory.connectors"
+
+# Statements which only read data and keep the result cache, any other
+# statement (INSERT ... RETURNING, WITH ... UPDATE, DDL) invalidates it.
+READ_STATEMENTS = ("select", "show", "describe", "desc", "explain")
+
+
+def is_read_statement(sql: str):
+    """Return True if the statement only reads data."""
+    return str(sql).lstrip(" \t\r\n(").lower().startswith(READ_STATEMENTS)
+
+
+def register_connector(connector_type: str, connector):
+    """Register connector class for the connector type.
+
+    Args:
+        connector_type (str): Type of connector used in ConnectorFactory.
+        connector (str | type): Decorator subclass or "module:Class" to import on first use.
+    """
+    CONNECTORS[connector_type] = connector
+    if connector_type not in SUPPORTED_ENGINE:
+        SUPPORTED_ENGINE.append(connector_type)
+
+
+def load_connector(connector_type: str):
+    """Return the connector class of the connector type. Built-in connectors
+    and registered connectors are looked up first, then the entry points of
+    installed packages.
+
+    Args:
+        connector_type (str): Type of connector used in ConnectorFactory.
+
+    Returns:
+        connector: Decorator subclass or None if connector type is unknown.
+    """
+    connector = CONNECTORS.get(connector_type)
+
+    if connector is None:
+        from importlib.metadata import entry_points
+
+        try:
+            found = entry_points(group=ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python < 3.10 return dictonary of groups.
+            found = entry_points().get(ENTRY_POINT_GROUP, [])
+
+        for entry_point in found:
+            if entry_point.name == connector_type:
+                logger.info(
+                    f"Loading connector {connector_type} from entry point {entry_point.value}")
+                connector = entry_point.load()
+                register_connector(connector_type=connector_type,
+                                   connector=connector)
+                break
+
+    if isinstance(connector, str):
+        module_name, _, class_name = connector.partition(":")
+        connector = getattr(importlib.import_module(module_name), class_name)
+
+    return connector
 
 # SUPPORTED_SECRET_MANAGER_CLOUD = ["aws", "gcp"]
 
+# Result of single query of get_df_many and execute_many. error is None when
+# the query succeeded and elapsed is the wall time of the query in seconds.
+QueryResult = namedtuple("QueryResult", ["index", "sql", "result", "error", "elapsed"])
+
 
 class ConnectorFactory(object):
     """Class handle the Database Manager using SQLAlchemy Dialects or specific
@@ -59,18 +143,32 @@ class ConnectorFactory(object):
         create the uri for the provided engine with proper driver.
         create_session:         Method to create the SQLAlchemy session for the
                                 initalized the engine type.
+        transaction:            Context manager to defer the commit of multiple
+                                statements to the end of the block.
         execute_sql:            Function to execute DML or DDL queries and return
                                 with rows if rows exist.
         execute_df:             Function to execute Pandas DataFrame object.
         get_df:                 Function to execute DML select queries and return
                                 as Pandas DataFrame.
+        get_df_many:            Function to execute many DML select queries
+                                concurrently and return as Pandas DataFrames.
+        execute_many:           Function to execute many DML or DDL queries
+                                concurrently.
+        iter_df:                Function to execute DML select queries and yield
+                                Pandas DataFrame chunks lazily.
+        get_arrow:              Function to execute DML select queries and return
+                                as pyarrow Table or RecordBatchReader.
+        get_polars:             Function to execute DML select queries and return
+                                as Polars DataFrame.
+        invalidate_cache:       Function to remove cached results of get_df.
         object
     """
 
     def __init__(self,
                  connector_type: str,
                  config: dict,
-                 debug: bool = False
+                 debug: bool = False,
+                 cache=None
                  ):
         """Initialization function to initlaize the object
 
@@ -91,6 +189,7 @@ class ConnectorFactory(object):
                                     * dynamodb
             config (dict):  (Required) => Dictonary of connection details like username, password, host, port etc.
             debug (bool, optional): (Optional) => Detailed logs for debugging.. Defaults to False.
+            cache (ResultCache, optional): (Optional) => Result cache for get_df. Same cache can be shared by many factories. Cached results of the connector are invalidated on execute_sql writes and execute_df. Defaults to None to disable the cache.
         """
 
         self.engine_type = connector_type
@@ -100,47 +199,14 @@ class ConnectorFactory(object):
         self.config["debug"] = self.debug
         self.connection = None
         self.is_connector = False
+        self.cache = cache
+        self.identity = Common.fingerprint(self.engine_type,
+                                           {key: value for key, value in self.config.items()
+                                            if key != "debug"})
 
-        if self.engine_type in ["sqlite"]:
-            from .connectors.sqlite3 import Sqlite3 as Connector
-            self.is_connector = True
-        elif self.engine_type in ["postgre"]:
-            from .connectors.postgreSQL import PostgreSQL as Connector
-            self.is_connector = True
-        elif self.engine_type in ["mysql", "mariadb"]:
-            from .connectors.mysql import Mysql as Connector
-            self.is_connector = True
-        elif self.engine_type in ["snowflake"]:
-            from .connectors.snowflake import Snowflake as Connector
+        Connector = load_connector(self.engine_type)
+        if Connector is not None:
             self.is_connector = True
-        elif self.engine_type in ["bigquery"]:
-            pass
-        elif self.engine_type in ["salesforce"]:
-            from .connectors.salesforce import Salesforce as Connector
-            self.is_connector = True
-        elif self.engine_type in ["redshift"]:
-            from .connectors.redshift import Redshift as Connector
-            self.is_connector = True
-        elif self.engine_type in ["s3select"]:
-            from .connectors.s3select import S3Select as Connector
-            self.is_connector = True
-        elif self.engine_type in ["aws"]:
-            from .connectors.aws import Aws as Connector
-            self.is_connector = True
-        elif self.engine_type in ["databricks"]:
-            from .connectors.databricks import Databricks as Connector
-            self.is_connector = True
-        elif self.engine_type in ["synapse"]:
-            from .connectors.synapse import Synapse as Connector
-            self.is_connector = True
-        elif self.engine_type in ["db2"]:
-            from .connectors.db2 import Db2 as Connector
-            self.is_connector = True
-        elif self.engine_type in ["dynamodb"]:
-            from .connectors.dynamodb import DynamoDb as Connector
-            self.is_connector = True
-
-        if self.is_connector:
             self.connection = Connector(self.config)
 
     def create_session(self):
@@ -158,7 +224,7 @@ class ConnectorFactory(object):
                 logger.info(f"Connection session scope is created")
             except Exception as err:
                 logger.exception(
-                    f"Failed to create session with given paramaters for Database", err)
+                    f"Failed to create session with given paramaters for Database")
                 raise ValueError(err)
         else:
             return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
@@ -205,7 +271,48 @@ class ConnectorFactory(object):
         else:
             return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
 
-    def execute_sql(self, sql: str):
+    def transaction(self):
+        """
+        Context manager to run multiple execute_sql, execute_df and get_df
+        calls in single transaction. Commit happens once at the exit of the
+        block and everything is rolled back if the block raise error.
+
+        Ex:
+            with db.transaction():
+                db.execute_sql(sql="insert into test values (1)")
+                db.execute_sql(sql="insert into test values (2)")
+
+        *******
+        Return:
+        -------
+
+            transaction:    Context manager of the transaction.
+        """
+
+        if self.is_connector:
+            return self.__transaction()
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    @contextmanager
+    def __transaction(self):
+        outermost = not self.connection.in_transaction()
+        try:
+            with self.connection.transaction() as connection:
+                yield connection
+        finally:
+            if outermost:
+                # Results cached by other threads between the writes and the
+                # commit are stale, invalidate once more at the end.
+                self.invalidate_cache()
+
+    def batch(self):
+        """
+        Alias of transaction to batch multiple statements in single commit.
+        """
+        return self.transaction()
+
+    def execute_sql(self, sql: str, params=None):
         """
         Function to execute DML or DDL queries and return if rows exist.
 
@@ -218,6 +325,11 @@ class ConnectorFactory(object):
                         Default is None. One of paramater sql_query or
                         panda_df is required. If both is provided panda_df
                         will be taken as priority and sql_query is ignored.
+            params:     (Optional) => Values of :name bind parameters in sql.
+                        Dictonary executes the statement once and list of
+                        dictonary executes it as executemany in single
+                        round trip.
+                        Default is None.
         *******
         Return:
         -------
@@ -226,7 +338,11 @@ class ConnectorFactory(object):
         """
 
         if self.is_connector:
-            return self.connection.execute_sql(sql=sql)
+            try:
+                return self.connection.execute_sql(sql=sql, params=params)
+            finally:
+                if not is_read_statement(sql):
+                    self.invalidate_cache()
         else:
             return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
 
@@ -234,7 +350,8 @@ class ConnectorFactory(object):
                    panda_df: pandas.DataFrame,
                    table_name: str,
                    chunk_size: int = None,
-                   exist_action: str = "append"):
+                   exist_action: str = "append",
+                   load_method: str = None):
         """
         Function to execute Pandas DataFrame object to create, replace or
         append table with DataFrame table objects.
@@ -256,6 +373,10 @@ class ConnectorFactory(object):
             exist_action:   (Optional) => Action on if table already exist.
                             Default: append mode. Others modes are replace
                             or fail.
+            load_method:    (Optional) => How rows are sent to the database.
+                            One of insert, multi or connector specific bulk
+                            load method like copy for PostgreSQL.
+                            Default: insert.
         *******
         Return:
         -------
@@ -264,19 +385,29 @@ class ConnectorFactory(object):
         """
 
         if self.is_connector:
+            self.invalidate_cache()
             return self.connection.execute_df(panda_df=panda_df,
                                               table_name=table_name,
                                               chunk_size=chunk_size,
-                                              exist_action=exist_action)
+                                              exist_action=exist_action,
+                                              load_method=load_method)
         else:
             return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
 
     def get_df(self,
                sql: str,
-               chunk_size: int = None):
+               chunk_size: int = None,
+               partition_on: str = None,
+               num_partitions: int = None,
+               lower_bound=None,
+               upper_bound=None,
+               predicates: list = None,
+               max_workers: int = None):
         """
         Function to execute DML select queries and return Pandas DataFrame
-        object.
+        object. With partition_on or predicates the query is split in
+        partitions which are read concurrently on separate connections of the
+        pool, like get_df_many, and concatenated in order of the partitions.
 
         ***********
         Attributes:
@@ -291,6 +422,19 @@ class ConnectorFactory(object):
                             where chunk_size is the number of rows to include
                             in each chunk.
                             Default: None to include all records.
+            partition_on:   (Optional) => Numeric, date or datetime column to
+                            split the query in range partitions.
+                            Default: None to read in single query.
+            num_partitions: (Optional) => Number of range partitions of
+                            partition_on.
+            lower_bound:    (Optional) => Lower bound of partition_on.
+                            Default: None to query MIN of the column.
+            upper_bound:    (Optional) => Upper bound of partition_on.
+                            Default: None to query MAX of the column.
+            predicates:     (Optional) => List of WHERE conditions, one per
+                            partition. Takes priority over partition_on.
+            max_workers:    (Optional) => Number of partitions read at the
+                            same time, capped to the connection pool size.
         *******
         Return:
         -------
@@ -299,10 +443,318 @@ class ConnectorFactory(object):
         """
 
         if self.is_connector:
-            return self.connection.get_df(sql=sql, chunk_size=chunk_size)
+            # Partitioned reads are not cached, the cache is keyed by sql only.
+            use_cache = (self.cache is not None
+                         and not (partition_on or predicates)
+                         and not self.connection.in_transaction())
+            if use_cache:
+                df = self.cache.get(identity=self.identity, sql=sql)
+                if df is not None:
+                    logger.info(f"Return cached result of sql {sql}")
+                    return df
+
+            if partition_on or predicates:
+                df = self.__get_partitioned_df(sql=sql,
+                                               chunk_size=chunk_size,
+                                               partition_on=partition_on,
+                                               num_partitions=num_partitions,
+                                               lower_bound=lower_bound,
+                                               upper_bound=upper_bound,
+                                               predicates=predicates,
+                                               max_workers=max_workers)
+            else:
+                df = self.connection.get_df(sql=sql, chunk_size=chunk_size)
+
+            if use_cache:
+                self.cache.put(identity=self.identity, sql=sql, df=df)
+            return df
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    def __get_partitioned_df(self,
+                             sql: str,
+                             chunk_size: int,
+                             partition_on: str,
+                             num_partitions: int,
+                             lower_bound,
+                             upper_bound,
+                             predicates: list,
+                             max_workers: int):
+        self.create_session()
+        queries = self.connection.get_partition_queries(sql=sql,
+                                                        partition_on=partition_on,
+                                                        num_partitions=num_partitions,
+                                                        lower_bound=lower_bound,
+                                                        upper_bound=upper_bound,
+                                                        predicates=predicates)
+        calls = [(query, {"chunk_size": chunk_size}) for query in queries]
+        results = self.__run_many(func=self.connection.get_df,
+                                  calls=calls,
+                                  max_workers=max_workers,
+                                  ordered=True)
+
+        for result in results:
+            if result.error is not None:
+                msg = f"Failed to read partition {result.index} of the query: {result.error}"
+                logger.error(msg)
+                raise ValueError(msg)
+
+        import pandas
+
+        return pandas.concat([result.result for result in results],
+                             ignore_index=True)
+
+    def get_df_many(self,
+                    queries: list,
+                    max_workers: int = None,
+                    ordered: bool = True,
+                    chunk_size: int = None):
+        """
+        Function to execute many independent DML select queries concurrently
+        on a bounded thread pool. Each worker runs on its own connection of the
+        pool and failure of a query is reported in its result without
+        aborting the other queries. Workers do not see uncommitted writes of
+        transaction block of the caller.
+
+        ***********
+        Attributes:
+        -----------
+
+            queries:        (Required) => List of plain DML select queries.
+            max_workers:    (Optional) => Number of queries executed at the
+                            same time. It is capped to the size of the
+                            connection pool (pool_size + max_overflow).
+                            Default: None to use the connection pool size.
+            ordered:        (Optional) => Return list of results in order of
+                            queries if True else generator yielding results
+                            as they complete.
+                            Default: True.
+            chunk_size:     (Optional) => Number of rows fetched per round
+                            trip, same as get_df.
+                            Default: None to fetch all records at once.
+        *******
+        Return:
+        -------
+
+            results:        List or generator of QueryResult(index, sql,
+                            result, error, elapsed) where result is the
+                            Pandas DataFrame.
+        """
+
+        if self.is_connector:
+            calls = [(sql, {"chunk_size": chunk_size}) for sql in queries]
+            return self.__run_many(func=self.get_df,
+                                   calls=calls,
+                                   max_workers=max_workers,
+                                   ordered=ordered)
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    def execute_many(self,
+                     statements: list,
+                     max_workers: int = None,
+                     ordered: bool = True):
+        """
+        Function to execute many independent DML or DDL queries concurrently
+        on a bounded thread pool. Each query is committed on its own and
+        failure of a query is reported in its result without aborting the
+        other queries.
+
+        ***********
+        Attributes:
+        -----------
+
+            statements:     (Required) => List of plain queries or tuple of
+                            query and bind parameters like execute_sql.
+            max_workers:    (Optional) => Number of queries executed at the
+                            same time. It is capped to the size of the
+                            connection pool (pool_size + max_overflow).
+                            Default: None to use the connection pool size.
+            ordered:        (Optional) => Return list of results in order of
+                            statements if True else generator yielding
+                            results as they complete.
+                            Default: True.
+        *******
+        Return:
+        -------
+
+            results:        List or generator of QueryResult(index, sql,
+                            result, error, elapsed) where result is the rows
+                            returned by execute_sql.
+        """
+
+        if self.is_connector:
+            calls = []
+            for statement in statements:
+                if isinstance(statement, (tuple, list)):
+                    sql, params = statement
+                else:
+                    sql, params = statement, None
+                calls.append((sql, {"params": params}))
+            return self.__run_many(func=self.execute_sql,
+                                   calls=calls,
+                                   max_workers=max_workers,
+                                   ordered=ordered)
         else:
             return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
 
+    def __run_many(self, func, calls: list, max_workers: int, ordered: bool):
+        if not calls:
+            return [] if ordered else iter([])
+
+        # Engine is created once before the workers start.
+        self.create_session()
+
+        limit = self.connection.get_max_workers()
+        if not max_workers:
+            max_workers = limit or min(32, (os.cpu_count() or 1) + 4)
+        elif limit and max_workers > limit:
+            logger.info(
+                f"Max workers {max_workers} is reduced to {limit} to stay under the connection pool size")
+            max_workers = limit
+        max_workers = max(1, min(max_workers, len(calls)))
+        logger.info(f"Executing {len(calls)} queries with {max_workers} workers")
+
+        def run(index, sql, kwargs):
+            start = time.perf_counter()
+            try:
+                result = func(sql=sql, **kwargs)
+                return QueryResult(index, sql, result, None, time.perf_counter() - start)
+            except Exception as err:
+                logger.error(f"Query {index} failed: {err}")
+                return QueryResult(index, sql, None, err, time.perf_counter() - start)
+            finally:
+                self.connection.release_session()
+
+        if not ordered:
+            return self.__iter_completed(run=run, calls=calls, max_workers=max_workers)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers,
+                                      thread_name_prefix="connector_factory")
+        try:
+            futures = [executor.submit(run, index, sql, kwargs)
+                       for index, (sql, kwargs) in enumerate(calls)]
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown()
+
+    @staticmethod
+    def __iter_completed(run, calls: list, max_workers: int):
+        # Queries are submitted on the first next(), so a generator which is
+        # never iterated holds no worker threads or connections.
+        executor = ThreadPoolExecutor(max_workers=max_workers,
+                                      thread_name_prefix="connector_factory")
+        try:
+            futures = [executor.submit(run, index, sql, kwargs)
+                       for index, (sql, kwargs) in enumerate(calls)]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def iter_df(self,
+                sql: str,
+                chunk_size: int):
+        """
+        Function to execute DML select queries and lazily yield Pandas
+        DataFrame chunks instead of building one DataFrame for the whole
+        result.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            chunk_size:     (Required) => Number of rows to include in each
+                            chunk.
+        *******
+        Return:
+        -------
+
+            generator:      Generator of Pandas DataFrame chunks.
+        """
+
+        if self.is_connector:
+            return self.connection.iter_df(sql=sql, chunk_size=chunk_size)
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    def get_arrow(self,
+                  sql: str,
+                  batch_size: int = None):
+        """
+        Function to execute DML select queries and return Apache Arrow data.
+        Requires pyarrow to be installed (connector-factory["arrow"]).
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            batch_size:     (Optional) => If specified, return a streaming
+                            pyarrow.RecordBatchReader where batch_size is the
+                            number of rows in each record batch.
+                            Default: None to return a pyarrow.Table with all
+                            records.
+        *******
+        Return:
+        -------
+
+            table:          pyarrow.Table or pyarrow.RecordBatchReader if
+                            batch_size is given.
+        """
+
+        if self.is_connector:
+            return self.connection.get_arrow(sql=sql, batch_size=batch_size)
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    def get_polars(self,
+                   sql: str,
+                   batch_size: int = None):
+        """
+        Function to execute DML select queries and return Polars DataFrame
+        object. Requires polars to be installed (connector-factory["polars"]).
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Required) => Plain DML select query to execute on
+                            Database.
+            batch_size:     (Optional) => Number of rows fetched from the
+                            database per round trip.
+                            Default: None to fetch all records at once.
+        *******
+        Return:
+        -------
+
+            df:             Polars DataFrame.
+        """
+
+        if self.is_connector:
+            return self.connection.get_polars(sql=sql, batch_size=batch_size)
+        else:
+            return f"Invalid connection type : {self.engine_type}. Valid type is anyone from {SUPPORTED_ENGINE}"
+
+    def invalidate_cache(self, sql: str = None):
+        """
+        Function to remove cached results of this connector.
+
+        ***********
+        Attributes:
+        -----------
+
+            sql:            (Optional) => Query to remove from cache.
+                            Default: None to remove all cached results of
+                            the connector.
+        """
+
+        if self.cache is not None:
+            self.cache.invalidate(identity=self.identity, sql=sql)
+
     def destroy(self):
         """
         Function to close the sessions.
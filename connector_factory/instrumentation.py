@@ -0,0 +1,363 @@
+#!/usr/bin/env python
+
+"""
+File holds the per query instrumentation of the connectors. Every call of
+execute_sql, execute_df, get_df, iter_df and get_arrow creates a QueryEvent
+with latency, rows, bytes, connector type and error class which is sent to
+the registered listeners. In debug mode the event also holds the time of the
+phases of the call, which is logged, and the call can be profiled with
+cProfile. Without listener and debug the calls run without creating any event.
+"""
+
+import bisect
+import contextlib
+import io
+import logging
+import os
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Listeners notified of every query. Kept as module list so the check of the
+# no-op fast path is a single truth test.
+LISTENERS = []
+
+# Upper bounds in seconds of the Prometheus latency histogram.
+DEFAULT_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+_NOOP = contextlib.nullcontext()
+
+# Only the outermost call of a thread is profiled, nested calls are part of
+# its profile.
+_PROFILING = threading.local()
+
+
+class QueryEvent(object):
+    """Record of single connector call.
+
+    Attributes:
+        connector_type (str): Connection type of the connector like postgre.
+        operation (str): Method of the connector like get_df.
+        sql (str): Query of the call or table name of execute_df.
+        start_time (int): Wall clock start of the call in nanoseconds since epoch.
+        duration (float): Latency of the call in seconds.
+        rows (int): Rows returned or written, None if not known.
+        bytes (int): Bytes returned or written, None if not known.
+        error (str): Class name of the exception raised by the call, None on success.
+        phases (dict): Seconds spent per phase like connect, execute, fetch, convert and concat.
+    """
+
+    __slots__ = ["connector_type", "operation", "sql", "start_time",
+                 "duration", "rows", "bytes", "error", "phases"]
+
+    def __init__(self, connector_type: str, operation: str, sql: str = None):
+        self.connector_type = connector_type
+        self.operation = operation
+        self.sql = sql
+        self.start_time = None
+        self.duration = None
+        self.rows = None
+        self.bytes = None
+        self.error = None
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Add wall time of the block to the phase. Same phase can be timed
+        many times, like fetch of each chunk."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def add(self, data=None, rows: int = None, nbytes: int = None):
+        """Add rows and bytes of Pandas DataFrame, pyarrow Table or
+        RecordBatch, or explicit counts, to the event."""
+        if data is not None:
+            rows = len(data)
+            if hasattr(data, "memory_usage"):
+                nbytes = int(data.memory_usage(index=False).sum())
+            elif hasattr(data, "nbytes"):
+                nbytes = int(data.nbytes)
+
+        if rows is not None:
+            self.rows = (self.rows or 0) + rows
+        if nbytes is not None:
+            self.bytes = (self.bytes or 0) + nbytes
+
+    def __repr__(self):
+        return (f"QueryEvent(connector_type={self.connector_type!r}, operation={self.operation!r}, "
+                f"duration={self.duration!r}, rows={self.rows!r}, bytes={self.bytes!r}, error={self.error!r})")
+
+
+class _Span(object):
+    __slots__ = ["event", "debug", "profile_dir", "_start", "_profiler"]
+
+    def __init__(self, event: QueryEvent, debug: bool = False, profile_dir: str = None):
+        self.event = event
+        self.debug = debug
+        self.profile_dir = profile_dir
+        self._start = None
+        self._profiler = None
+
+    def __enter__(self):
+        if self.profile_dir and not getattr(_PROFILING, "active", False):
+            import cProfile
+
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                self._profiler = profiler
+                _PROFILING.active = True
+            except ValueError:
+                # Another profiler is already active in the interpreter.
+                logger.warning(f"Skip profiling of {self.event.operation}, another profiler is active")
+
+        self.event.start_time = time.time_ns()
+        self._start = time.perf_counter()
+        return self.event
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.event.duration = time.perf_counter() - self._start
+        # Generator closed by the consumer before the end is not an error.
+        if exc_type is not None and not issubclass(exc_type, GeneratorExit):
+            self.event.error = exc_type.__name__
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            _PROFILING.active = False
+            self._dump_profile()
+
+        if self.debug:
+            phases = " ".join(f"{name}={value:.4f}s" for name, value in self.event.phases.items())
+            logger.info(
+                f"{self.event.connector_type} {self.event.operation} took {self.event.duration:.4f}s"
+                f"{', rows=' + str(self.event.rows) if self.event.rows is not None else ''}"
+                f"{', phases: ' + phases if phases else ''}")
+
+        for listener in list(LISTENERS):
+            try:
+                listener.on_query(self.event)
+            except Exception:
+                logger.exception(f"Query listener {listener} failed")
+        return False
+
+    def _dump_profile(self):
+        import pstats
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        path = os.path.join(self.profile_dir,
+                            f"{self.event.connector_type}-{self.event.operation}-{self.event.start_time}.prof")
+        self._profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        pstats.Stats(self._profiler, stream=summary).sort_stats("cumulative").print_stats(15)
+        logger.info(f"Profile of {self.event.operation} is written to {path}{os.linesep}{summary.getvalue()}")
+
+
+def instrument(connector_type: str,
+               operation: str,
+               sql: str = None,
+               debug: bool = False,
+               profile_dir: str = None):
+    """Return context manager which measures the block and notify listeners.
+    The context manager yields the QueryEvent, or None if no listener is
+    registered and debug is off, so callers add rows and bytes only when
+    instrumented.
+
+    Args:
+        connector_type (str): Connection type of the connector.
+        operation (str): Method of the connector.
+        sql (str, optional): Query of the call. Defaults to None.
+        debug (bool, optional): Log duration and phases of the call. Defaults to False.
+        profile_dir (str, optional): Folder to dump cProfile stats of the call. Defaults to None.
+
+    Returns:
+        context: Context manager yielding QueryEvent or None.
+    """
+    if not LISTENERS and not debug:
+        return _NOOP
+    return _Span(QueryEvent(connector_type=connector_type,
+                            operation=operation,
+                            sql=sql),
+                 debug=debug,
+                 profile_dir=profile_dir if debug else None)
+
+
+def phase(event: QueryEvent, name: str):
+    """Return context manager timing the phase of the event, no-op if event
+    is None."""
+    if event is None:
+        return _NOOP
+    return event.phase(name)
+
+
+def add_listener(listener):
+    """Register listener with on_query(event) method for all connectors."""
+    if listener not in LISTENERS:
+        LISTENERS.append(listener)
+    return listener
+
+
+def remove_listener(listener):
+    """Unregister listener added with add_listener."""
+    if listener in LISTENERS:
+        LISTENERS.remove(listener)
+
+
+class QueryListener(object):
+    """Base class of the listeners. on_query is called once per connector
+    call after it finished, in the thread of the call."""
+
+    def on_query(self, event: QueryEvent):
+        pass
+
+
+class OpenTelemetryListener(QueryListener):
+    """Listener exporting every query as OpenTelemetry span. Requires
+    opentelemetry-api, spans are exported by the SDK configured by the
+    application.
+    """
+
+    def __init__(self, tracer=None, record_sql: bool = True):
+        """Initialization function to initlaize the object
+
+        Args:
+            tracer (opentelemetry.trace.Tracer, optional): (Optional) => Tracer to create spans. Defaults to None to use tracer of global provider.
+            record_sql (bool, optional): (Optional) => Add query as db.statement attribute. Defaults to True.
+        """
+        from opentelemetry import trace
+
+        self.trace = trace
+        self.tracer = tracer or trace.get_tracer("connector_factory")
+        self.record_sql = record_sql
+
+    def on_query(self, event: QueryEvent):
+        attributes = {"db.system": event.connector_type,
+                      "db.operation": event.operation}
+        if self.record_sql and event.sql:
+            attributes["db.statement"] = event.sql
+        if event.rows is not None:
+            attributes["db.rows"] = event.rows
+        if event.bytes is not None:
+            attributes["db.bytes"] = event.bytes
+        if event.error:
+            attributes["error.type"] = event.error
+
+        span = self.tracer.start_span(name=f"{event.connector_type}.{event.operation}",
+                                      kind=self.trace.SpanKind.CLIENT,
+                                      attributes=attributes,
+                                      start_time=event.start_time)
+        if event.error:
+            span.set_status(self.trace.Status(self.trace.StatusCode.ERROR, event.error))
+        span.end(end_time=event.start_time + int(event.duration * 1e9))
+
+
+class PrometheusListener(QueryListener):
+    """Listener aggregating queries in Prometheus metrics. render returns the
+    metrics in Prometheus text format and serve exposes them over HTTP, no
+    Prometheus client library is required.
+
+    Metrics:
+        connector_factory_queries_total: Counter of calls by connector, operation and error.
+        connector_factory_query_duration_seconds: Histogram of latency by connector and operation.
+        connector_factory_rows_total: Counter of rows returned or written.
+        connector_factory_bytes_total: Counter of bytes returned or written.
+    """
+
+    def __init__(self, buckets: list = None):
+        """Initialization function to initlaize the object
+
+        Args:
+            buckets (list, optional): (Optional) => Upper bounds in seconds of the latency histogram. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = sorted(buckets or DEFAULT_BUCKETS)
+        self._queries = {}
+        self._durations = {}
+        self._rows = {}
+        self._bytes = {}
+        self._lock = threading.Lock()
+
+    def on_query(self, event: QueryEvent):
+        key = (event.connector_type, event.operation)
+        with self._lock:
+            count_key = key + (event.error or "",)
+            self._queries[count_key] = self._queries.get(count_key, 0) + 1
+
+            counts, total = self._durations.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect.bisect_left(self.buckets, event.duration)] += 1
+            self._durations[key] = (counts, total + event.duration)
+
+            if event.rows is not None:
+                self._rows[key] = self._rows.get(key, 0) + event.rows
+            if event.bytes is not None:
+                self._bytes[key] = self._bytes.get(key, 0) + event.bytes
+
+    @staticmethod
+    def _labels(connector_type, operation, **extra):
+        labels = {"connector": connector_type, "operation": operation, **extra}
+        values = ",".join(f'{name}="{str(value)}"' for name, value in labels.items())
+        return f"{{{values}}}"
+
+    def render(self):
+        """Return the metrics in Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines.append("# TYPE connector_factory_queries_total counter")
+            for (connector_type, operation, error), value in sorted(self._queries.items()):
+                labels = self._labels(connector_type, operation, error=error)
+                lines.append(f"connector_factory_queries_total{labels} {value}")
+
+            lines.append("# TYPE connector_factory_query_duration_seconds histogram")
+            for (connector_type, operation), (counts, total) in sorted(self._durations.items()):
+                cumulative = 0
+                for bucket, count in zip(self.buckets + ["+Inf"], counts):
+                    cumulative += count
+                    labels = self._labels(connector_type, operation, le=bucket)
+                    lines.append(f"connector_factory_query_duration_seconds_bucket{labels} {cumulative}")
+                labels = self._labels(connector_type, operation)
+                lines.append(f"connector_factory_query_duration_seconds_sum{labels} {total}")
+                lines.append(f"connector_factory_query_duration_seconds_count{labels} {cumulative}")
+
+            for name, values in [("rows", self._rows), ("bytes", self._bytes)]:
+                lines.append(f"# TYPE connector_factory_{name}_total counter")
+                for (connector_type, operation), value in sorted(values.items()):
+                    labels = self._labels(connector_type, operation)
+                    lines.append(f"connector_factory_{name}_total{labels} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, addr: str = ""):
+        """Serve the metrics on http://addr:port/metrics from daemon thread.
+
+        Args:
+            port (int, optional): (Optional) => Port to listen. Defaults to 9464.
+            addr (str, optional): (Optional) => Address to bind. Defaults to all interfaces.
+
+        Returns:
+            server: http.server.ThreadingHTTPServer, call shutdown to stop.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        listener = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = listener.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        logger.info(f"Serving Prometheus metrics on port {server.server_address[1]}")
+        return server
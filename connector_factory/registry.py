@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+
+"""
+File holds the process wide registry of SQLAlchemy engines. Connectors with
+"shared_engine" in config reuse the engine, and so the connection pool, of
+identical connection details instead of creating a new engine per factory.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from .common.common import Common
+
+
+logger = logging.getLogger(__name__)
+
+
+class EngineRegistry(object):
+    """Class handle the shared SQLAlchemy engines of the process.
+
+    Engines are keyed by fingerprint of the connection uri and engine
+    parameters, secrets are hashed and never kept in plain text. Each acquire
+    increase the reference count of the engine and release decrease it.
+    Engines without reference are disposed when idle for idle_timeout seconds
+    or, least recently used first, when more than max_engines are registered.
+
+    Methods:
+    --------
+
+        acquire:                Return shared engine of connection details.
+        release:                Release the reference of the engine.
+        evict_idle:             Dispose engines idle for idle_timeout.
+        dispose_all:            Dispose all engines.
+    """
+
+    def __init__(self,
+                 max_engines: int = 32,
+                 idle_timeout: float = 600):
+        """Initialization function to initlaize the object
+
+        Args:
+            max_engines (int, optional): (Optional) => Maximum engines kept in registry. Defaults to 32.
+            idle_timeout (float, optional): (Optional) => Seconds after which an engine without reference is disposed. Defaults to 600.
+        """
+        self.max_engines = max_engines
+        self.idle_timeout = idle_timeout
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+        atexit.register(self.dispose_all)
+
+    def __len__(self):
+        return len(self._engines)
+
+    @staticmethod
+    def fingerprint(uri, param: dict = None):
+        """Return the key of the connection details.
+
+        Args:
+            uri (str | sqlalchemy.engine.URL): Connection string of database.
+            param (dict, optional): Parameters of create_engine. Defaults to None.
+
+        Returns:
+            key: Hex digest of connection details.
+        """
+        if hasattr(uri, "render_as_string"):
+            uri = uri.render_as_string(hide_password=False)
+        return Common.fingerprint(str(uri), param or {})
+
+    def acquire(self, uri, param: dict, create):
+        """Return the shared engine of the connection details, the engine is
+        created with create callable if not registered.
+
+        Args:
+            uri (str | sqlalchemy.engine.URL): Connection string of database.
+            param (dict): Parameters of create_engine.
+            create (callable): Function without arguments to create the engine.
+
+        Returns:
+            key, engine: Key to release the engine and the engine.
+        """
+        key = self.fingerprint(uri=uri, param=param)
+        with self._lock:
+            entry = self._engines.get(key)
+            if entry:
+                logger.info("Reusing shared SQLAlchemy engine from registry")
+                entry["references"] += 1
+                entry["last_used"] = time.monotonic()
+                self._engines.move_to_end(key)
+                return key, entry["engine"]
+
+            logger.info("Creating shared SQLAlchemy engine in registry")
+            engine = create()
+            self._engines[key] = {"engine": engine,
+                                  "references": 1,
+                                  "last_used": time.monotonic()}
+            self._evict()
+            return key, engine
+
+    def release(self, key: str):
+        """Release the reference of the engine. Engine is kept open for reuse
+        until it is evicted.
+
+        Args:
+            key (str): Key returned by acquire.
+        """
+        with self._lock:
+            entry = self._engines.get(key)
+            if entry:
+                entry["references"] = max(entry["references"] - 1, 0)
+                entry["last_used"] = time.monotonic()
+            self._evict()
+
+    def evict_idle(self):
+        """Dispose the engines without reference idle for idle_timeout."""
+        with self._lock:
+            self._evict()
+
+    def dispose_all(self):
+        """Dispose all engines of the registry."""
+        with self._lock:
+            for key in list(self._engines):
+                self._dispose(key)
+
+    def _evict(self):
+        now = time.monotonic()
+        idle = [key for key, entry in self._engines.items()
+                if not entry["references"]
+                and self.idle_timeout is not None
+                and now - entry["last_used"] >= self.idle_timeout]
+        for key in idle:
+            self._dispose(key)
+
+        # Least recently used first, engines in use are never disposed.
+        for key in list(self._engines):
+            if len(self._engines) <= self.max_engines:
+                break
+            if not self._engines[key]["references"]:
+                self._dispose(key)
+
+        if len(self._engines) > self.max_engines:
+            logger.warning(
+                f"{len(self._engines)} engines are in use, more than max engines {self.max_engines}")
+
+    def _dispose(self, key: str):
+        entry = self._engines.pop(key)
+        try:
+            entry["engine"].dispose()
+            logger.info("Disposed shared SQLAlchemy engine from registry")
+        except Exception:
+            logger.error("Failed to dispose shared SQLAlchemy engine")
+
+
+ENGINE_REGISTRY = EngineRegistry()
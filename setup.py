@@ -215,6 +215,29 @@ dynamodb = [
     "urllib3<=1.26.19"
 ]
 
+arrow = [
+    # Columnar in-memory analytics, RecordBatchReader.from_batches and
+    # Field.with_type of get_arrow
+    "pyarrow>=12.0.0,<=16.1.0"
+]
+
+polars = arrow + [
+    # DataFrame library built on Apache Arrow
+    "polars>=0.20.0,<=1.0.0"
+]
+
+opentelemetry = [
+    # Export query spans with OpenTelemetryListener
+    "opentelemetry-api<=1.25.0"
+]
+
+asyncio = [
+    # Async drivers of AsyncConnectorFactory
+    "asyncpg<=0.29.0",
+    "aiomysql<=0.2.0",
+    "aiosqlite<=0.20.0"
+]
+
 
 setups = [
     'gitpython',
@@ -236,6 +259,10 @@ extras = {
     "synapse": synapse,
     "db2": db2,
     "dynamodb": dynamodb,
+    "arrow": arrow,
+    "polars": polars,
+    "async": asyncio,
+    "opentelemetry": opentelemetry,
     "all": (snowflake + aws + postgres + redshift + mysql + salesforce + databricks + synapse + db2 + dynamodb)
 }
 